@@ -0,0 +1,74 @@
+#!/bin/bash
+
+# =============================================================================
+# Compile Script for Commit Gen
+# =============================================================================
+#
+# DESCRIPTION:
+#   Compiles the CLI launcher modules to C extensions with mypyc.
+#   src/app.py and src/common/arguments.py run on every invocation before
+#   any command does useful work, so compiling them trims startup latency.
+#   Domain modules stay pure Python; their cost is dominated by I/O.
+#
+# FEATURES:
+#   • Builds extension modules next to their sources (picked up by the
+#     editable install from dev/build.sh)
+#   • Removes compiled artifacts to return to pure Python
+#
+# REQUIREMENTS:
+#   • uv: Modern Python package manager
+#   • mypy (dev dependency, ships mypyc)
+#   • A C compiler
+#
+# USAGE:
+#   ./dev/compile.sh          Compile launcher modules
+#   ./dev/compile.sh clean    Remove compiled artifacts
+#
+# =============================================================================
+
+set -e
+
+PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$PROJECT_ROOT/src"
+
+MODULES="app.py common/arguments.py"
+
+# =============================================================================
+# FUNCTION: clean
+# =============================================================================
+# Removes compiled extension modules and the mypyc build directory.
+#
+# PARAMETERS: None
+# RETURNS: None
+# =============================================================================
+clean() {
+    echo "󰅖 Removing compiled modules..."
+    rm -f ./*.so common/*.so
+    rm -rf build .mypy_cache
+}
+
+# =============================================================================
+# FUNCTION: compile
+# =============================================================================
+# Compiles the launcher modules with mypyc.
+#
+# BEHAVIOR:
+#   1. Cleans previous artifacts
+#   2. Compiles app.py and common/arguments.py in place
+#
+# PARAMETERS: None
+# RETURNS: None
+# =============================================================================
+compile() {
+    clean
+    echo "󰏖 Compiling launcher modules with mypyc..."
+    uv run mypyc --explicit-package-bases --ignore-missing-imports $MODULES
+    echo "󰄬 Compiled: $MODULES"
+}
+
+if [ "$1" = "clean" ]; then
+    clean
+    echo "󰄬 Back to pure Python."
+else
+    compile
+fi
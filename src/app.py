@@ -2,33 +2,30 @@
 
 import sys
 import asyncio
+import functools
 
-from typing import List, Optional, Union
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Coroutine, Final, List, Mapping, Optional, Union
 
-from dotenv import load_dotenv
-from rich.console import Console
-
-from common.base import BaseFrozen
 from common.result import Result, Ok, Err
-from common.updater import check_and_update
-from common.arguments import CommandType, ParsedArgs, create_parser
-from common.config import is_ready
-from common.doctor import execute_doctor
-from common.updater import execute_update
-from domains.commit.command.commit import execute_commit
-from domains.setup.command.setup import execute_setup
+from common.arguments import CommandType, ParsedArgs, create_parser, fast_dispatch, format_version, version_requested
 
 
-class UserCancelled(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class UserCancelled:
     pass
 
 
-class AppError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class AppError:
     message: str
 
 
 AppErrorType = Union[UserCancelled, AppError]
 
+_SETUP_EXEMPT = frozenset({CommandType.SETUP, CommandType.HELP, CommandType.DOCTOR})
+
 
 def error_to_message(error: AppErrorType) -> str:
     match error:
@@ -38,72 +35,126 @@ def error_to_message(error: AppErrorType) -> str:
             return f"Error: {m}"
 
 
+@functools.cache
+def _load_env_once() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 def initialize() -> None:
     """Load environment variables."""
-    load_dotenv()
+    _load_env_once()
+
+
+def _run_async(coro: Coroutine[Any, Any, int]) -> int:
+    with asyncio.Runner() as runner:
+        if sys.version_info >= (3, 12):
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        return runner.run(coro)
+
+
+def _run_generate() -> int:
+    from domains.commit.command.commit import execute_commit
+
+    return _run_async(execute_commit("generate"))
+
+
+def _run_update() -> int:
+    from common.updater import execute_update
+
+    return execute_update()
+
+
+def _run_setup() -> int:
+    from domains.setup.command.setup import execute_setup
+
+    return _run_async(execute_setup())
+
+
+def _run_doctor() -> int:
+    from common.doctor import execute_doctor
+
+    return execute_doctor()
+
+
+_HANDLERS: Final[Mapping[CommandType, Callable[[], int]]] = MappingProxyType(
+    {
+        CommandType.GENERATE: _run_generate,
+        CommandType.UPDATE: _run_update,
+        CommandType.SETUP: _run_setup,
+        CommandType.DOCTOR: _run_doctor,
+        CommandType.HELP: lambda: 1,
+    }
+)
 
 
 def run_command(command_type: CommandType) -> int:
-    """Execute the appropriate command handler."""
-    match command_type:
-        case CommandType.GENERATE:
-            return asyncio.run(execute_commit("generate"))
-        case CommandType.UPDATE:
-            return execute_update()
-        case CommandType.SETUP:
-            return asyncio.run(execute_setup())
-        case CommandType.DOCTOR:
-            return execute_doctor()
-        case CommandType.HELP:
-            return 1
+    """Execute the appropriate command handler, importing it on demand."""
+    return _HANDLERS[command_type]()
 
 
 def run(args: Optional[List[str]] = None) -> Result[AppErrorType, int]:
     """Main application entry point."""
-    parser = create_parser()
+    argv = sys.argv[1:] if args is None else args
+    command_type = fast_dispatch(argv)
 
-    try:
+    if command_type is None:
+        if version_requested(argv):
+            print(format_version())
+            return Result.ok(0)
+
+        parser = create_parser()
         namespace = parser.parse_args(args)
-    except SystemExit:
-        return Result.ok(1)
+        parsed_args = ParsedArgs(command=getattr(namespace, "command", None))
+        command_type = parsed_args.get_command_type()
+
+        if command_type == CommandType.HELP:
+            parser.print_help()
+            return Result.ok(1)
 
-    parsed_args = ParsedArgs(command=getattr(namespace, "command", None))
-    command_type = parsed_args.get_command_type()
+    if command_type != CommandType.UPDATE:
+        from common.updater import check_and_update
 
-    if not is_ready() and command_type not in (CommandType.SETUP, CommandType.HELP, CommandType.DOCTOR):
-        return Result.ok(asyncio.run(execute_setup()))
+        check_and_update()
 
-    if command_type == CommandType.HELP:
-        parser.print_help()
-        return Result.ok(1)
+    from common.config import is_ready
+
+    if command_type not in _SETUP_EXEMPT and not is_ready():
+        return Result.ok(run_command(CommandType.SETUP))
 
     return Result.ok(run_command(command_type))
 
 
+def _print_error(message: str) -> None:
+    from rich.console import Console
+
+    Console().print(message)
+
+
 def safe_run(args: Optional[List[str]] = None) -> int:
     """Wrapper that catches exceptions and returns exit code."""
-    console = Console()
-
     try:
         result = run(args)
         match result.inner:
             case Ok(value=exit_code):
                 return exit_code
             case Err(error=e):
-                console.print(f"[red]{error_to_message(e)}[/red]")
+                _print_error(f"[red]{error_to_message(e)}[/red]")
                 return 1
     except KeyboardInterrupt:
-        console.print("\n\nOperation cancelled by user.")
+        _print_error("\n\nOperation cancelled by user.")
         return 1
-    except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
+    except (OSError, ValueError) as e:
+        _print_error(f"[red]Error: {e}[/red]")
         return 1
 
 
 def main() -> int:
-    initialize()
-    check_and_update()
-    return safe_run(sys.argv[1:])
+    args = sys.argv[1:]
+    if fast_dispatch(args) != CommandType.UPDATE:
+        initialize()
+    return safe_run(args)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
 import argparse
+import functools
+import sys
 
-from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass, field
+from typing import Dict, Final, List, Optional, Tuple
 from enum import Enum
-from importlib.metadata import PackageNotFoundError, version as get_version
 
 
 class CommandType(Enum):
@@ -14,41 +15,69 @@ class CommandType(Enum):
     HELP = "help"
 
 
-class ParsedArgs(BaseModel):
-    model_config = ConfigDict(frozen=True)
+_CMD_MAP: Final[Dict[str, CommandType]] = {
+    command_type.value: command_type for command_type in CommandType if command_type is not CommandType.HELP
+}
 
+
+@dataclass(frozen=True, slots=True)
+class ParsedArgs:
     command: Optional[str] = None
+    _command_type: CommandType = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.command is None:
+            object.__setattr__(self, "_command_type", CommandType.HELP)
+            return
+        command = sys.intern(self.command)
+        object.__setattr__(self, "command", command)
+        object.__setattr__(self, "_command_type", _CMD_MAP.get(command, CommandType.HELP))
 
     def get_command_type(self) -> CommandType:
-        match self.command:
-            case "generate":
-                return CommandType.GENERATE
-            case "update":
-                return CommandType.UPDATE
-            case "setup":
-                return CommandType.SETUP
-            case "doctor":
-                return CommandType.DOCTOR
-            case _:
-                return CommandType.HELP
+        return self._command_type
 
 
 class CommitGenCLIConfig:
-    prog = "commit"
-    description = "Commit Gen - AI-powered commit message generator"
-    epilog = "Examples:\n    commit generate\n    commit update"
+    prog: Final = "commit"
+    description: Final = "Commit Gen - AI-powered commit message generator"
+    epilog: Final = "Examples:\n    commit generate\n    commit update"
+
 
+_SUBCOMMANDS: Final[Tuple[Tuple[CommandType, str], ...]] = (
+    (CommandType.GENERATE, "Generate a commit message"),
+    (CommandType.UPDATE, "Update commit-gen to the latest version"),
+    (CommandType.SETUP, "Configure commit-gen"),
+    (CommandType.DOCTOR, "Diagnose installation and PATH issues"),
+)
 
-PACKAGE_NAME = "commit-gen"
+_VERSION_FLAGS = frozenset({"-v", "--version"})
 
 
+@functools.cache
 def resolve_version() -> str:
     try:
-        return get_version(PACKAGE_NAME)
-    except PackageNotFoundError:
+        from common._version import __version__
+    except ImportError:
         return "unknown"
+    return __version__
+
+
+def version_requested(argv: List[str]) -> bool:
+    return len(argv) == 1 and argv[0] in _VERSION_FLAGS
+
+
+def format_version() -> str:
+    return f"{CommitGenCLIConfig.prog} {resolve_version()}"
+
+
+def fast_dispatch(argv: List[str]) -> Optional[CommandType]:
+    if len(argv) == 1:
+        return _CMD_MAP.get(argv[0])
+    return None
 
 
+# argparse parsers hold no per-parse state, so one instance is safely reused across parse_args() calls.
+@functools.cache
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog=CommitGenCLIConfig.prog,
@@ -61,9 +90,7 @@ def create_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    subparsers.add_parser("generate", help="Generate a commit message")
-    subparsers.add_parser("update", help="Update commit-gen to the latest version")
-    subparsers.add_parser("setup", help="Configure commit-gen")
-    subparsers.add_parser("doctor", help="Diagnose installation and PATH issues")
+    for command_type, help_text in _SUBCOMMANDS:
+        subparsers.add_parser(command_type.value, help=help_text)
 
     return parser
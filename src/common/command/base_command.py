@@ -1,6 +1,7 @@
 from abc import ABC
-from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass
 
 
-class BaseCommand(BaseModel, ABC):
-    model_config = ConfigDict(frozen=True)
+@dataclass(frozen=True)
+class BaseCommand(ABC):
+    pass
@@ -1,16 +1,17 @@
-from typing import Type, TypeVar, Callable, Awaitable, Optional, Dict, Any, assert_never
+from dataclasses import dataclass, fields
+from typing import Type, TypeVar, Callable, Awaitable, Optional, Dict, Any
 from common.http_response import json_response as json_response, to_response
 from common.json_parser import try_parse_json
-from common.result import Ok, Err
+from common.result import Err
 from common.command.base_command import BaseCommand
 from common.command.base_command_handler import BaseCommandHandler
-from common.base import BaseFrozen
 from common.errors import Fail, Forbidden, Unauthorized, BadRequest, InternalServerError
 
 
-class BaseCommandResponse(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class BaseCommandResponse:
     def to_dict(self) -> Dict[str, Any]:
-        return self.__dict__
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 C = TypeVar("C", bound=BaseCommand)
@@ -19,14 +20,10 @@ C = TypeVar("C", bound=BaseCommand)
 async def execute_command_handler(
     command_type: Type[C], request_data: Dict[str, Any], command_handler: Callable[[], BaseCommandHandler[C]]
 ) -> tuple[Dict[str, Any], int]:
-    rcommand = try_parse_json(command_type, request_data)
-    match rcommand.inner:
-        case Err(error=error):
-            return to_response(BadRequest(message=f"Invalid request schema: {error}"))
-        case Ok(value=value):
-            command = value
-        case _:
-            assert_never(rcommand)
+    rcommand = try_parse_json(command_type, request_data).inner
+    if isinstance(rcommand, Err):
+        return to_response(BadRequest(message=f"Invalid request schema: {rcommand.error}"))
+    command = rcommand.value
 
     try:
         result = await command_handler().handle_command(command)
@@ -60,15 +57,15 @@ async def retrying_on_failure(
     max_retries: int, action: Callable[[], Awaitable[tuple[Dict[str, Any], int]]]
 ) -> tuple[Dict[str, Any], int]:
     error: Optional[Exception] = None
-    retry_count = 0
 
-    while retry_count < max_retries:
+    for _ in range(max_retries):
+        if error is not None:
+            # Only the final failure is chained; drop earlier frames before retrying.
+            error.__traceback__ = None
         try:
-            response = await action()
-            return response
+            return await action()
         except Exception as err:
             error = err
-            retry_count += 1
 
     if error is None:
         raise RuntimeError("Retries exhausted without an error")
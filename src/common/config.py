@@ -1,15 +1,23 @@
+import functools
 import json
 import os
-import platform
+import sys
 
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import Final, Optional, Union
+
+import orjson
+
+from pydantic import ValidationError
 
 from common.base import BaseFrozen
 from common.result import Result, Ok, Err, try_catch
 
 
+IS_WINDOWS: Final[bool] = sys.platform == "win32"
+
+
 class CommitConvention(str, Enum):
     CONVENTIONAL = "conventional"
     IMPERATIVE = "imperative"
@@ -54,14 +62,16 @@ def validate_commit_convention(value: str) -> Result[ConfigParseError, CommitCon
         return Result.err(ConfigParseError(message=f"Invalid commit convention: {value}"))
 
 
+@functools.cache
 def get_home_path() -> Path:
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         userprofile = os.environ.get("USERPROFILE")
         if userprofile:
             return Path(userprofile)
     return Path.home()
 
 
+@functools.cache
 def get_config_dir() -> Path:
     return get_home_path() / ".commit-gen"
 
@@ -70,7 +80,7 @@ def get_legacy_config_dir() -> Path:
     return get_home_path() / ".quick-assistant"
 
 
-
+@functools.cache
 def get_config_path() -> Path:
     return get_config_dir() / "config.json"
 
@@ -78,36 +88,23 @@ def get_config_path() -> Path:
 def load_config() -> Result[ConfigError, Config]:
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        data = json.loads(config_path.read_text())
+    except FileNotFoundError:
         return Result.err(ConfigNotFound(path=str(config_path)))
+    except (OSError, ValueError) as e:
+        return Result.err(ConfigParseError(message=str(e)))
 
-    read_result = try_catch(lambda: config_path.read_text())
-    match read_result.inner:
-        case Err(error=e):
-            return Result.err(ConfigParseError(message=str(e)))
-        case Ok(value=content):
-            pass
-
-    parse_result = try_catch(lambda: json.loads(content))
-    match parse_result.inner:
-        case Err(error=parse_err):
-            return Result.err(ConfigParseError(message=str(parse_err)))
-        case Ok(value=data):
-            pass
-
-    convention_result = validate_commit_convention(data.get("commit_convention", ""))
-    match convention_result.inner:
+    match validate_commit_convention(data.get("commit_convention", "")).inner:
         case Err(error=conv_err):
             return Result.err(conv_err)
         case Ok(value=convention):
             data["commit_convention"] = convention
 
-    validate_result = try_catch(lambda: Config(**data))
-    match validate_result.inner:
-        case Err(error=validation_err):
-            return Result.err(ConfigParseError(message=str(validation_err)))
-        case Ok(value=config):
-            return Result.ok(config)
+    try:
+        return Result.ok(Config(**data))
+    except ValidationError as e:
+        return Result.err(ConfigParseError(message=str(e)))
 
 
 def save_config(config: Config) -> Result[ConfigWriteError, None]:
@@ -126,11 +123,13 @@ def save_config(config: Config) -> Result[ConfigWriteError, None]:
         "custom_template": config.custom_template,
     }
 
-    write_result = try_catch(lambda: config_path.write_text(json.dumps(data, indent=2)))
+    write_result = try_catch(lambda: config_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2)))
     match write_result.inner:
         case Err(error=e):
             return Result.err(ConfigWriteError(message=str(e)))
         case Ok():
+            is_ready.cache_clear()
+            reset_api_key_cache()
             return Result.ok(None)
 
 
@@ -138,6 +137,8 @@ def is_configured() -> bool:
     return get_config_path().exists()
 
 
+# Cached per process; save_config() invalidates it, other config or GOOGLE_API_KEY changes need is_ready.cache_clear().
+@functools.cache
 def is_ready() -> bool:
     env_key = os.getenv("GOOGLE_API_KEY")
     if env_key:
@@ -145,14 +146,28 @@ def is_ready() -> bool:
     return get_config_path().exists()
 
 
+_api_key_cache: Optional[str] = None
+
+
+def reset_api_key_cache() -> None:
+    global _api_key_cache
+    _api_key_cache = None
+
+
 def get_api_key() -> Result[ConfigNotFound, str]:
+    global _api_key_cache
+    if _api_key_cache is not None:
+        return Result.ok(_api_key_cache)
+
     env_key = os.getenv("GOOGLE_API_KEY")
     if env_key:
+        _api_key_cache = env_key
         return Result.ok(env_key)
 
     config_result = load_config()
     match config_result.inner:
         case Ok(value=config):
+            _api_key_cache = config.api_key
             return Result.ok(config.api_key)
         case Err(error=e):
             match e:
@@ -1,11 +1,16 @@
-from rich.console import Console
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-_console: Console | None = None
 
+_console: "Console | None" = None
 
-def get_console() -> Console:
+
+def get_console() -> "Console":
     global _console
     if _console is None:
+        from rich.console import Console
+
         _console = Console()
     return _console
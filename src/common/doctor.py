@@ -1,50 +1,55 @@
+import functools
 import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Union
-from importlib.metadata import version as get_pkg_version
+from typing import TYPE_CHECKING, Union
 
-from common.base import BaseFrozen
 from common.result import Result, Ok, Err
-from rich.console import Console
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-PACKAGE_NAME = "commit-gen"
 
-
-class VersionRetrievalError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class VersionRetrievalError:
     message: str
 
 
-class PathCheckError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class PathCheckError:
     message: str
 
 
 DoctorError = Union[VersionRetrievalError, PathCheckError]
 
 
-class DiagnosticsInfo(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class DiagnosticsInfo:
     version: str
     platform: str
     python_version: str
     executable: str
 
 
-class PathIssue(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class PathIssue:
     name: str
     path: str
 
 
-class DoctorResult(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class DoctorResult:
     info: DiagnosticsInfo
     issues: tuple[PathIssue, ...]
 
 
 def get_version() -> Result[VersionRetrievalError, str]:
     try:
-        return Result.ok(get_pkg_version(PACKAGE_NAME))
-    except Exception as e:
+        from common._version import __version__
+    except ImportError as e:
         return Result.err(VersionRetrievalError(message=str(e)))
+    return Result.ok(__version__)
 
 
 def get_diagnostics_info() -> Result[DoctorError, DiagnosticsInfo]:
@@ -60,17 +65,26 @@ def get_diagnostics_info() -> Result[DoctorError, DiagnosticsInfo]:
             )
 
 
+@functools.cache
+def get_scripts_dir() -> Path:
+    return Path(sys.executable).parent / "Scripts"
+
+
+def _normalize_path_entry(entry: str) -> str:
+    return entry.rstrip("\\/").lower()
+
+
 def check_windows_path() -> Result[PathCheckError, tuple[PathIssue, ...]]:
-    scripts_dir = Path(sys.executable).parent / "Scripts"
+    scripts_dir = get_scripts_dir()
     pipx_bin = Path.home() / ".local" / "bin"
-    path_env = os.environ.get("PATH", "")
+    path_entries = {_normalize_path_entry(entry) for entry in os.environ.get("PATH", "").split(os.pathsep)}
 
     issues: list[PathIssue] = []
 
-    if scripts_dir.exists() and str(scripts_dir).lower() not in path_env.lower():
+    if scripts_dir.exists() and _normalize_path_entry(str(scripts_dir)) not in path_entries:
         issues.append(PathIssue(name="pip Scripts", path=str(scripts_dir)))
 
-    if pipx_bin.exists() and str(pipx_bin).lower() not in path_env.lower():
+    if pipx_bin.exists() and _normalize_path_entry(str(pipx_bin)) not in path_entries:
         issues.append(PathIssue(name="pipx bin", path=str(pipx_bin)))
 
     return Result.ok(tuple(issues))
@@ -103,7 +117,7 @@ def error_to_message(error: DoctorError) -> str:
             return f"PATH check failed: {m}"
 
 
-def _print_diagnostics(console: Console, info: DiagnosticsInfo) -> None:
+def _print_diagnostics(console: "Console", info: DiagnosticsInfo) -> None:
     console.print("Commit Gen - System Diagnostics\n")
     console.print(f"Version: {info.version}")
     console.print(f"Platform: {info.platform}")
@@ -111,7 +125,7 @@ def _print_diagnostics(console: Console, info: DiagnosticsInfo) -> None:
     console.print(f"Executable: {info.executable}")
 
 
-def _print_issues(console: Console, issues: tuple[PathIssue, ...]) -> None:
+def _print_issues(console: "Console", issues: tuple[PathIssue, ...]) -> None:
     console.print("\nPATH issues detected:\n")
     for issue in issues:
         console.print(f"  - {issue.name} not in PATH: {issue.path}")
@@ -121,13 +135,12 @@ def _print_issues(console: Console, issues: tuple[PathIssue, ...]) -> None:
     console.print("     pipx ensurepath")
     console.print("")
     console.print("  2. For pip installations, add to PATH manually:")
-    scripts_dir = Path(sys.executable).parent / "Scripts"
-    console.print(f'     setx PATH "%PATH%;{scripts_dir}"')
+    console.print(f'     setx PATH "%PATH%;{get_scripts_dir()}"')
     console.print("")
     console.print("  3. Restart your terminal after making changes.")
 
 
-def _print_success(console: Console) -> None:
+def _print_success(console: "Console") -> None:
     if sys.platform == "win32":
         console.print("\nPATH appears correctly configured.")
     else:
@@ -135,6 +148,8 @@ def _print_success(console: Console) -> None:
 
 
 def execute_doctor() -> int:
+    from rich.console import Console
+
     console = Console()
     result = run_doctor()
 
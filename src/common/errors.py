@@ -31,5 +31,6 @@ class InternalServerError(Exception):
 
 
 def annotate(message: str, error: Exception) -> Exception:
-    error.args = (f"{message}: {error.args[0]}" if error.args else message,) + error.args[1:]
+    args = error.args
+    error.args = (f"{message}: {args[0]}", *args[1:]) if args else (message,)
     return error
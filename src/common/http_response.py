@@ -1,27 +1,33 @@
-from typing import Union, Any, Dict
+from typing import Union, Any, Dict, Final
 from common.errors import Fail, Forbidden, Unauthorized, BadRequest, InternalServerError
 from common.json import to_json
 
 
+_STATUS_BY_FAILURE: Final[Dict[type, int]] = {
+    Forbidden: 403,
+    Unauthorized: 401,
+    BadRequest: 400,
+    InternalServerError: 500,
+}
+
+
+def _status_for(failure: Exception) -> int:
+    status = _STATUS_BY_FAILURE.get(type(failure))
+    if status is not None:
+        return status
+    return next(value for cls, value in _STATUS_BY_FAILURE.items() if isinstance(failure, cls))
+
+
 def to_response(
     failure: Union[Fail, Forbidden, Unauthorized, BadRequest, InternalServerError],
 ) -> tuple[Dict[str, Any], int]:
-    match failure:
-        case Fail():
-            content = {"error": {"message": failure.message, "details": failure.details}}
-            return content, failure.code
-        case Forbidden():
-            content = {"error": {"message": failure.message}}
-            return content, 403
-        case Unauthorized():
-            content = {"error": {"message": failure.message}}
-            return content, 401
-        case BadRequest():
-            content = {"error": {"message": failure.message, "details": failure.details}}
-            return content, 400
-        case InternalServerError():
-            content = {"error": {"message": failure.message}}
-            return content, 500
+    if isinstance(failure, Fail):
+        return {"error": {"message": failure.message, "details": failure.details}}, failure.code
+
+    error: Dict[str, Any] = {"message": failure.message}
+    if isinstance(failure, BadRequest):
+        error["details"] = failure.details
+    return {"error": error}, _status_for(failure)
 
 
 def json_response(data: Union[Dict[str, Any], Any], status: int = 200) -> tuple[Dict[str, Any], int]:
@@ -17,7 +17,8 @@ from typing import (
     assert_never,
 )
 from decimal import Decimal
-from json import dumps
+import json as json_stdlib
+import orjson
 from common.reflection import concrete_type_hints, get_type_constructor, UnboundTypeVar
 from common.result import Result, Ok, Err
 from pydantic import ValidationError
@@ -25,10 +26,15 @@ from pydantic import ValidationError
 
 T = TypeVar("T")
 
+# Bound once so the per-element leaf parsers skip the attribute lookup on Result.
+_ok = Result.ok
+_err = Result.err
+
 
 class ParsingOptions(BaseModel):
     model_config = ConfigDict(strict=True, frozen=True, arbitrary_types_allowed=False, extra="forbid")
     fill_missing_optionals: bool
+    reject_ambiguous_unions: bool = False
 
 
 defaultParsingOptions = ParsingOptions(fill_missing_optionals=False)
@@ -49,35 +55,77 @@ def try_parse_json(ty: Type[T], data: JSONObject, opts: ParsingOptions = default
 
 
 def to_json(data: Serializeable) -> JSONObject:
-    if isinstance(data, int) or isinstance(data, float) or isinstance(data, str) or data is None:
+    handler = _TO_JSON_BY_TYPE.get(type(data))
+    if handler is not None:
+        return handler(data)
+
+    if isinstance(data, ToJSON):
+        return data.to_json()
+
+    # Subclasses of the built-ins (str enums, OrderedDict, ...) miss the exact-type table.
+    if isinstance(data, int) or isinstance(data, float) or isinstance(data, str):
         return data
 
     if isinstance(data, list) or isinstance(data, set):
-        return [to_json(element) for element in data]
+        return _list_to_json(data)
 
     if isinstance(data, dict):
-        return {key: to_json(value) for key, value in data.items()}
+        return _dict_to_json(data)
 
     if isinstance(data, Decimal):
         return str(data)
 
-    if isinstance(data, ToJSON):
-        return data.to_json()
-
     raise ValueError(f"Cannot convert {type(data).__name__} to JSON")
 
 
+def _scalar_to_json(data: Any) -> JSONObject:
+    return data
+
+
+def _list_to_json(data: Any) -> JSONObject:
+    return [to_json(element) for element in data]
+
+
+def _dict_to_json(data: Any) -> JSONObject:
+    return {key: to_json(value) for key, value in data.items()}
+
+
+_TO_JSON_BY_TYPE: Dict[type, Callable[[Any], JSONObject]] = {
+    int: _scalar_to_json,
+    bool: _scalar_to_json,
+    float: _scalar_to_json,
+    str: _scalar_to_json,
+    type(None): _scalar_to_json,
+    list: _list_to_json,
+    set: _list_to_json,
+    dict: _dict_to_json,
+    Decimal: str,
+}
+
+
 JSONObject = str | float | int | None | list | dict
 
 
+_PROPERTIES: Dict[type, tuple[str, ...]] = {}
+
+
 class ToJSON:
     def to_json(self: Self) -> JSONObject:
-        properties: List[str] = list(get_type_hints(self.__class__).keys())
+        cls = self.__class__
+        properties = _PROPERTIES.get(cls)
+        if properties is None:
+            properties = _PROPERTIES[cls] = tuple(get_type_hints(cls).keys())
         return {prop: to_json(self.__dict__[prop]) for prop in properties}
 
 
+_OPTIONAL_TYPES: Dict[Any, bool] = {}
+
+
 def is_optional(typ: Type[Any]) -> bool:
-    return get_origin(typ) is Union and type(None) in get_args(typ)
+    optional = _OPTIONAL_TYPES.get(typ)
+    if optional is None:
+        optional = _OPTIONAL_TYPES[typ] = get_origin(typ) is Union and type(None) in get_args(typ)
+    return optional
 
 
 class FromJSON:
@@ -86,56 +134,76 @@ class FromJSON:
         return parser_for_class(cls)(json, opts)
 
 
+_MISSING = object()
+
+_CLASS_PARSERS: Dict[Any, Parser[Any]] = {}
+
+
 def parser_for_class(cls: Type[T]) -> Parser[T]:
+    parser = _CLASS_PARSERS.get(cls)
+    if parser is None:
+        parser = _CLASS_PARSERS[cls] = build_class_parser(cls)
+    return parser
+
+
+def build_class_parser(cls: Type[T]) -> Parser[T]:
+    rhints = try_concrete_type_hints(cls)
+    match rhints.inner:
+        case Err(error=error):
+            hints_error = f"When decoding {repr(cls)}\n{error}"
+            return lambda json, opts: Result.err(hints_error)
+        case Ok(value=hints):
+            plan: tuple[tuple[str, Parser[Any], bool], ...] = tuple(
+                (field, parser_for(field_type), is_optional(field_type)) for field, field_type in hints.items()
+            )
+
     def class_parser(json: JSONObject, opts: ParsingOptions = defaultParsingOptions) -> Result[str, T]:
         if not isinstance(json, dict):
             return Result.err(
                 f"Expected dict but found {type(json).__name__}, when decoding {cls.__name__} from value: {dumps(json)}"
             )
 
-        rhints = try_concrete_type_hints(cls)
-        match rhints.inner:
-            case Err(error=error):
-                return Result.err(f"When decoding {repr(cls)}\n{error}")
-            case Ok(value=hints):
-                args: dict[str, Any] = {}
-                for field, field_type in hints.items():
-                    if field not in json:
-                        if is_optional(field_type) and opts.fill_missing_optionals:
-                            args[field] = None
-                        continue
-                    parsed = parser_for(field_type)(json[field], opts)
-                    match parsed.inner:
-                        case Ok(value=value):
-                            args[field] = value
-                        case Err(error=error):
-                            return Result.err(f"Parsing field '{field}': {error}")
-                try:
-                    return Result.ok(cls(**args))
-                except ValidationError as e:
-
-                    def pretty_loc(v: tuple[int | str, ...] | None) -> str:
-                        if v is None:
-                            return ""
-                        return ".".join([f"'{str(el)}'" for el in list(v)])
-
-                    return Result.err(
-                        ". ".join(
-                            [
-                                pretty_loc(details.get("loc")) + ": " + (details.get("msg") or "")
-                                for details in e.errors()
-                            ]
-                        )
-                    )
+        args: dict[str, Any] = {}
+        for field, field_parser, optional in plan:
+            raw = json.get(field, _MISSING)
+            if raw is _MISSING:
+                if optional and opts.fill_missing_optionals:
+                    args[field] = None
+                continue
+            parsed = field_parser(raw, opts).inner
+            if isinstance(parsed, Err):
+                return Result.err(f"Parsing field '{field}': {parsed.error}")
+            args[field] = parsed.value
+        try:
+            return Result.ok(cls(**args))
+        except ValidationError as e:
+
+            def pretty_loc(v: tuple[int | str, ...] | None) -> str:
+                if v is None:
+                    return ""
+                return ".".join([f"'{str(el)}'" for el in list(v)])
+
+            return Result.err(
+                ". ".join(
+                    [pretty_loc(details.get("loc")) + ": " + (details.get("msg") or "") for details in e.errors()]
+                )
+            )
 
     return class_parser
 
 
+_TYPE_HINTS: Dict[Any, Result[str, Dict[str, Type]]] = {}
+
+
 def try_concrete_type_hints(ty: Type[T]) -> Result[str, Dict[str, Type]]:
-    try:
-        return Result.ok(concrete_type_hints(ty))
-    except UnboundTypeVar as e:
-        return Result.err(", ".join(list(e.args)))
+    hints = _TYPE_HINTS.get(ty)
+    if hints is None:
+        try:
+            hints = Result.ok(concrete_type_hints(ty))
+        except UnboundTypeVar as e:
+            hints = Result.err(", ".join(list(e.args)))
+        _TYPE_HINTS[ty] = hints
+    return hints
 
 
 BuiltInSupported = str | float | int | None | list | dict | set | Decimal
@@ -147,61 +215,76 @@ Parseable = JSONObject | FromJSON | BuiltInSupported
 Parser = Callable[[JSONObject, ParsingOptions], Result[str, T]]
 
 
+def dumps(json: JSONObject) -> str:
+    # orjson writes NaN and Infinity as null, which is acceptable in an error message.
+    try:
+        return orjson.dumps(json, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except (orjson.JSONEncodeError, TypeError):
+        # orjson rejects ints beyond 64 bits; the stdlib encoder handles them in the same compact layout.
+        return json_stdlib.dumps(json, default=str, separators=(",", ":"))
+
+
 def parse(ty: Type[T], data: JSONObject, opts: ParsingOptions) -> Result[str, T]:
     return parser_for(ty)(data, opts)
 
 
 def parse_any(json: JSONObject, _: ParsingOptions) -> Result[str, Any]:
-    return Result.ok(json)
+    return _ok(json)
 
 
 def parse_string(json: JSONObject, _: ParsingOptions) -> Result[str, str]:
-    if isinstance(json, str):
-        return Result.ok(json)
-    return Result.err(f"Expected str but found {type(json).__name__}")
+    if type(json) is str:
+        return _ok(json)
+    return _err(f"Expected str but found {type(json).__name__}")
 
 
 def parse_bool(json: JSONObject, _: ParsingOptions) -> Result[str, bool]:
-    if isinstance(json, bool):
-        return Result.ok(json)
-    return Result.err(f"Expected bool but found {type(json).__name__}")
+    if type(json) is bool:
+        return _ok(json)
+    return _err(f"Expected bool but found {type(json).__name__}")
 
 
 def parse_float(json: JSONObject, _: ParsingOptions) -> Result[str, float]:
-    if isinstance(json, float):
-        return Result.ok(json)
-    return Result.err(f"Expected float but found {type(json).__name__}")
+    if type(json) is float:
+        return _ok(json)
+    return _err(f"Expected float but found {type(json).__name__}")
 
 
 def parse_int(json: JSONObject, _: ParsingOptions) -> Result[str, int]:
-    if isinstance(json, int):
-        return Result.ok(json)
-    return Result.err(f"Expected int but found {type(json).__name__}")
+    if type(json) is int:
+        return _ok(json)
+    return _err(f"Expected int but found {type(json).__name__}")
 
 
 def parse_None(json: JSONObject, _: ParsingOptions) -> Result[str, None]:
-    if isinstance(json, type(None)):
-        return Result.ok(None)
-    return Result.err(f"Expected None but found {type(json).__name__}")
+    if json is None:
+        return _ok(None)
+    return _err(f"Expected None but found {type(json).__name__}")
 
 
-def parse_list(json: JSONObject, element_ty: Type[T], opts: ParsingOptions) -> Result[str, list[T]]:
-    if isinstance(json, list):
+# Lists of JSON scalars are validated in bulk; the per-element loop only runs to locate a bad element.
+_SCALAR_ELEMENT_TYPES: frozenset[Any] = frozenset({str, int, float, bool})
 
-        def parseAt(x: tuple[int, JSONObject]) -> Result[str, T]:
-            index, value = x
-            parser = parser_for(element_ty)
-            parsed = parser(value, opts)
-            return parsed.map_err(lambda err: f"At index {str(index)}: {err}")
 
-        return Result.traverse(list(enumerate(json)), parseAt)
-    return Result.err(f"Expected List but found {type(json).__name__}")
+def parse_list(json: JSONObject, element_ty: Type[T], opts: ParsingOptions) -> Result[str, list[T]]:
+    if isinstance(json, list):
+        if element_ty in _SCALAR_ELEMENT_TYPES and all(type(value) is element_ty for value in json):
+            return _ok(list(json))
+        parser = parser_for(element_ty)
+        values: list[Any] = [None] * len(json)
+        for index, value in enumerate(json):
+            parsed = parser(value, opts).inner
+            if isinstance(parsed, Err):
+                return _err(f"At index {index}: {parsed.error}")
+            values[index] = parsed.value
+        return _ok(values)
+    return _err(f"Expected List but found {type(json).__name__}")
 
 
 def parse_set(json: JSONObject, element_ty: Type[T], opts: ParsingOptions) -> Result[str, set[T]]:
     if isinstance(json, list):
         return parse_list(json, element_ty, opts).map(set)
-    return Result.err(f"Expected Set but found {type(json).__name__}")
+    return _err(f"Expected Set but found {type(json).__name__}")
 
 
 W = TypeVar("W")
@@ -209,19 +292,19 @@ W = TypeVar("W")
 
 def parse_dict(json: JSONObject, key_ty: Type[T], value_ty: Type[W], opts: ParsingOptions) -> Result[str, dict[T, W]]:
     if isinstance(json, dict):
+        key_parser = parser_for(key_ty)
+        value_parser = parser_for(value_ty)
         r = {}
         for key, value in json.items():
-            parsed_key = parse(key_ty, key, opts)
-            parsed_val = parse(value_ty, value, opts)
-            match parsed_key.inner:
-                case Err(error=error):
-                    return Result.err(f"Parsing key name {key}: {error}")
-            match parsed_val.inner:
-                case Err(error=error):
-                    return Result.err(f"Parsing key {key}: {error}")
-            r[parsed_key.inner.value] = parsed_val.inner.value
-        return Result.ok(r)
-    return Result.err(f"Expected Dict but found {type(json).__name__}")
+            parsed_key = key_parser(key, opts).inner
+            parsed_val = value_parser(value, opts).inner
+            if isinstance(parsed_key, Err):
+                return _err(f"Parsing key name {key}: {parsed_key.error}")
+            if isinstance(parsed_val, Err):
+                return _err(f"Parsing key {key}: {parsed_val.error}")
+            r[parsed_key.value] = parsed_val.value
+        return _ok(r)
+    return _err(f"Expected Dict but found {type(json).__name__}")
 
 
 def parse_decimal(json: JSONObject, opts: ParsingOptions) -> Result[str, Decimal]:
@@ -229,21 +312,48 @@ def parse_decimal(json: JSONObject, opts: ParsingOptions) -> Result[str, Decimal
 
 
 def parse_one_of(json: JSONObject, parsers: List[Parser[T]], opts: ParsingOptions) -> Result[str, T]:
-    parsed = [parser(json, opts).inner for parser in parsers]
-    successes = [result.value for result in parsed if isinstance(result, Ok)]
+    if opts.reject_ambiguous_unions:
+        return parse_exactly_one_of(json, parsers, opts)
 
-    if len(successes) == 0:
-        failures = [result.error for result in parsed if isinstance(result, Err)]
+    failures = []
+    for parser in parsers:
+        parsed = parser(json, opts)
+        inner = parsed.inner
+        if isinstance(inner, Ok):
+            return parsed
+        failures.append(inner.error)
+    return _err("No parse.\n" + "\n".join(failures))
+
+
+def parse_exactly_one_of(json: JSONObject, parsers: List[Parser[T]], opts: ParsingOptions) -> Result[str, T]:
+    successes: list[T] = []
+    failures: list[str] = []
+    for parser in parsers:
+        parsed = parser(json, opts).inner
+        if isinstance(parsed, Err):
+            failures.append(parsed.error)
+            continue
+        successes.append(parsed.value)
+        if len(successes) == 2:
+            return _err(f"Ambiguous parse of {dumps(json)}: {', '.join(map(str, successes))}")
+
+    if not successes:
+        return _err("No parse.\n" + "\n".join(failures))
+    return _ok(successes[0])
 
-        return Result.err("No parse.\n" + "\n".join(failures))
-    elif len(successes) == 1:
-        return Result.ok(successes[0])
-    else:
-        successes_str = map(lambda x: str(x), successes)
-        return Result.err(f"Ambiguous parse of {dumps(json)}: {successes_str}")
+
+# Parsers are resolved once per type: introspection dominates repeated parses of the same schema.
+_PARSERS: Dict[Any, Parser[Any]] = {}
 
 
 def parser_for(ty: Type[T]) -> Parser[T]:
+    parser = _PARSERS.get(ty)
+    if parser is None:
+        parser = _PARSERS[ty] = build_parser(ty)
+    return parser
+
+
+def build_parser(ty: Type[T]) -> Parser[T]:
     if ty is Any:
         return parse_any
     if ty is str:
@@ -256,20 +366,22 @@ def parser_for(ty: Type[T]) -> Parser[T]:
         return parse_int  # type: ignore
     if ty is type(None):
         return parse_None  # type: ignore
-    if get_type_constructor(ty) is list:
-        (element_ty,) = get_args(ty) or (Any,)
+    constructor = get_type_constructor(ty)
+    origin = get_origin(ty)
+    type_args = get_args(ty)
+    if constructor is list:
+        (element_ty,) = type_args or (Any,)
         return lambda json, opts: parse_list(json, element_ty, opts)  # type: ignore
-    if get_type_constructor(ty) is dict:
-        key_ty, value_ty = get_args(ty) or (Any, Any)
+    if constructor is dict:
+        key_ty, value_ty = type_args or (Any, Any)
         return lambda json, opts: parse_dict(json, key_ty, value_ty, opts)  # type: ignore
-    if get_type_constructor(ty) is set:
-        (element_ty,) = get_args(ty) or (Any,)
+    if constructor is set:
+        (element_ty,) = type_args or (Any,)
         return lambda json, opts: parse_set(json, element_ty, opts)  # type: ignore
     if ty is Decimal:
         return parse_decimal  # type: ignore
-    if get_origin(ty) is Union:
-        args = list(get_args(ty))
-        parsers = [parser_for(arg) for arg in args]
+    if origin is Union:
+        parsers = [parser_for(arg) for arg in type_args]
         return lambda json, opts: parse_one_of(json, parsers, opts)
 
     if isinstance(ty, NewType):
@@ -278,13 +390,32 @@ def parser_for(ty: Type[T]) -> Parser[T]:
     if isinstance(ty, type) and issubclass(ty, FromJSON):
         return lambda json, opts: ty.from_json(json, opts)  # type: ignore
 
-    if get_origin(ty) is Literal:
-        parsers = [parse_literal(arg) for arg in list(ty.__args__)]  # type: ignore
+    if origin is Literal:
+        if all(type(arg) in _LITERAL_SCALAR_TYPES for arg in type_args):
+            return parse_scalar_literal(type_args)
+        parsers = [parse_literal(arg) for arg in type_args]
         return lambda json, opts: parse_one_of(json, parsers, opts)
 
     raise ValueError(f"No JSON parser available for {ty.__name__}")
 
 
+_LITERAL_SCALAR_TYPES: frozenset[Any] = frozenset({str, int, bool, float, type(None)})
+
+
+def parse_scalar_literal(values: tuple[Any, ...]) -> Parser[Any]:
+    # Keyed by (type, value) so that True does not match Literal[1] and 1 does not match Literal[True].
+    allowed = frozenset((type(value), value) for value in values)
+    allowed_types = frozenset(type(value) for value in values)
+    expected = ", ".join(repr(value) for value in values)
+
+    def literal_parser(json: JSONObject, _: ParsingOptions) -> Result[str, Any]:
+        if type(json) in allowed_types and (type(json), json) in allowed:
+            return _ok(json)
+        return _err(f"Expected one of {expected} but found {dumps(json)}")
+
+    return literal_parser
+
+
 def parse_literal(arg: Any) -> Parser[T]:
     parser = parser_for(type(arg))
     return lambda value, opts: parser(value, opts).then(lambda v: check_literal(arg, v))
@@ -292,6 +423,6 @@ def parse_literal(arg: Any) -> Parser[T]:
 
 def check_literal(argument: Any, value: Any) -> Result[str, Any]:
     if argument == value:
-        return Result.ok(value)
+        return _ok(value)
     else:
-        return Result.err(f"Value mismatch. Expected {argument}, found {value}")
+        return _err(f"Value mismatch. Expected {argument}, found {value}")
@@ -1,17 +1,30 @@
 from typing import Type, TypeVar, Dict, Any
 from common.result import Result, Ok, Err
-from pydantic import BaseModel, ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 
-T = TypeVar("T", bound=BaseModel)
+T = TypeVar("T")
+
+# Building a TypeAdapter compiles a validator, so keep one per model type.
+_ADAPTERS: Dict[Any, TypeAdapter[Any]] = {}
+
+
+def _adapter_for(model_type: Type[T]) -> TypeAdapter[T]:
+    adapter = _ADAPTERS.get(model_type)
+    if adapter is None:
+        adapter = _ADAPTERS[model_type] = TypeAdapter(model_type)
+    return adapter
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    return "; ".join([f"{err['loc']}: {err['msg']}" for err in e.errors()])
 
 
 def try_parse_json(model_type: Type[T], data: Dict[str, Any]) -> Result[str, T]:
     try:
-        parsed = model_type.model_validate(data)
+        parsed = _adapter_for(model_type).validate_python(data)
         return Result(Ok(parsed))
     except ValidationError as e:
-        error_message = "; ".join([f"{err['loc']}: {err['msg']}" for err in e.errors()])
-        return Result(Err(error_message))
+        return Result(Err(_format_validation_error(e)))
     except Exception as e:
         return Result(Err(str(e)))
@@ -1,11 +1,24 @@
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator, Protocol
 
 from common.console import get_console
 
 
+class StatusDisplay(Protocol):
+    def update(self, status: Any = None) -> None: ...
+
+
+class _SilentStatus:
+    def update(self, status: Any = None) -> None:
+        pass
+
+
 @contextmanager
-def spinner(message: str, spinner_style: str = "dots") -> Generator[None, None, None]:
+def spinner(message: str, spinner_style: str = "dots") -> Generator[StatusDisplay, None, None]:
     console = get_console()
-    with console.status(message, spinner=spinner_style):
-        yield
+    # Piped or CI output has nobody watching the animation, so skip the live display and its refresh thread.
+    if not console.is_terminal:
+        yield _SilentStatus()
+        return
+    with console.status(message, spinner=spinner_style) as status:
+        yield status
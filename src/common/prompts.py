@@ -5,20 +5,25 @@ from typing import Optional
 from common.config import CommitConvention
 
 
+# System instructions never contain the diff: it is sent as the request contents, so the instruction prefix is
+# byte-identical across requests and can be served from the model's prompt cache.
+_TEMPLATE_PLACEHOLDER = "<<<TEMPLATE>>>"
+_DIFF_REFERENCE = "the git diff in the user message"
+
+
 def prompt_commit_message(
-    git_diff: str, convention: CommitConvention = CommitConvention.IMPERATIVE, custom_template: Optional[str] = None
+    convention: CommitConvention = CommitConvention.IMPERATIVE, custom_template: Optional[str] = None
 ) -> str:
     match convention:
         case CommitConvention.CONVENTIONAL:
-            return prompt_conventional(git_diff)
+            return CONVENTIONAL_PROMPT
         case CommitConvention.IMPERATIVE:
-            return prompt_imperative(git_diff)
+            return IMPERATIVE_PROMPT
         case CommitConvention.CUSTOM:
-            return prompt_custom(git_diff, custom_template)
+            return prompt_custom(custom_template)
 
 
-def prompt_conventional(git_diff: str) -> str:
-    return f"""
+CONVENTIONAL_PROMPT = """
       <system>
         You are an expert software engineer and version control specialist.
         Your job is to read git diffs and output high-quality commit messages
@@ -61,10 +66,10 @@ def prompt_conventional(git_diff: str) -> str:
             index 1234567..89abcde 100644
             --- a/src/logger.ts
             +++ b/src/logger.ts
-            @@ -10,7 +10,7 @@ export function logInfo(message: string) {{
+            @@ -10,7 +10,7 @@ export function logInfo(message: string) {
             -  console.log('[INFO]', message);
             +  console.log('[INFO]', new Date().toISOString(), message);
-            }}
+            }
           </git_diff>
           <classification>SMALL</classification>
           <commit_message>
@@ -74,9 +79,7 @@ def prompt_conventional(git_diff: str) -> str:
       </examples>
 
       <input>
-        <git_diff>
-          {git_diff}
-        </git_diff>
+        The git diff to analyze is the user message that follows these instructions.
       </input>
 
       <output_instructions>
@@ -95,8 +98,7 @@ def prompt_conventional(git_diff: str) -> str:
 """
 
 
-def prompt_imperative(git_diff: str) -> str:
-    return f"""
+IMPERATIVE_PROMPT = """
       <system>
         You are an expert software engineer and version control specialist.
         Your job is to read git diffs and output high-quality commit messages
@@ -138,10 +140,10 @@ def prompt_imperative(git_diff: str) -> str:
             index 1234567..89abcde 100644
             --- a/src/logger.ts
             +++ b/src/logger.ts
-            @@ -10,7 +10,7 @@ export function logInfo(message: string) {{
+            @@ -10,7 +10,7 @@ export function logInfo(message: string) {
             -  console.log('[INFO]', message);
             +  console.log('[INFO]', new Date().toISOString(), message);
-            }}
+            }
           </git_diff>
 
           <classification>SMALL</classification>
@@ -189,9 +191,7 @@ def prompt_imperative(git_diff: str) -> str:
       </examples>
 
       <input>
-        <git_diff>
-          {git_diff}
-        </git_diff>
+        The git diff to analyze is the user message that follows these instructions.
       </input>
 
       <output_instructions>
@@ -212,13 +212,7 @@ def prompt_imperative(git_diff: str) -> str:
 """
 
 
-def prompt_custom(git_diff: str, template: Optional[str]) -> str:
-    if not template:
-        return prompt_imperative(git_diff)
-
-    processed_template = template.replace("{diff}", git_diff)
-
-    return f"""
+_CUSTOM_TEMPLATE = """
       <system>
         You are an expert software engineer and version control specialist.
         Your job is to read git diffs and output high-quality commit messages
@@ -226,7 +220,7 @@ def prompt_custom(git_diff: str, template: Optional[str]) -> str:
       </system>
 
       <user_template>
-        {processed_template}
+        <<<TEMPLATE>>>
       </user_template>
 
       <output_instructions>
@@ -238,6 +232,18 @@ def prompt_custom(git_diff: str, template: Optional[str]) -> str:
 """
 
 
+_CUSTOM_HEAD, _CUSTOM_TAIL = _CUSTOM_TEMPLATE.split(_TEMPLATE_PLACEHOLDER)
+
+
+def prompt_custom(template: Optional[str]) -> str:
+    if not template:
+        return IMPERATIVE_PROMPT
+
+    processed_template = template.replace("{diff}", _DIFF_REFERENCE)
+
+    return f"{_CUSTOM_HEAD}{processed_template}{_CUSTOM_TAIL}"
+
+
 PROMPT_STYLE = Style(
     [
         ("question", "bold"),
@@ -1,82 +1,158 @@
-from typing import List, TypeVar, Type, Dict, Any, Union, get_type_hints
+from typing import Iterator, List, Tuple, TypeVar, Type, Dict, Any, Union, get_type_hints
 import typing
 from pathlib import Path
 import importlib
+import os
+import sys
 from common.result import Result, Ok, Err
 
 
 T = TypeVar("T")
 
 
-def leaf_classes(superclass: Type[T]) -> List[Type[T]]:
-    leaf_classes = []
+# Leaf sets are cached per superclass and tagged with the import generation they were computed in;
+# import_all bumps the generation since it is how new subclasses are loaded.
+_subclass_generation = 0
+_leaf_cache: Dict[type, Tuple[Tuple[type, ...], int]] = {}
 
-    def is_generic_leaf(parent: type, cls: type) -> bool:
-        is_leaf = len(cls.__subclasses__()) == 0
-        is_generic = get_type_constructor(cls) is parent
-        return is_leaf and is_generic
 
-    def find_subclasses(cls: type) -> None:
-        subclasses = [c for c in cls.__subclasses__() if not is_generic_leaf(cls, c)]
+def _is_generic_leaf(parent: type, cls: type) -> bool:
+    is_leaf = len(cls.__subclasses__()) == 0
+    is_generic = get_type_constructor(cls) is parent
+    return is_leaf and is_generic
 
-        for subclass in subclasses:
-            find_subclasses(subclass)
 
-        if not subclasses:
+def leaf_classes(superclass: Type[T]) -> List[Type[T]]:
+    cached = _leaf_cache.get(superclass)
+    if cached is not None and cached[1] == _subclass_generation:
+        return list(cached[0])
+
+    leaf_classes: List[type] = []
+    visited: set[type] = set()
+    stack: List[type] = [superclass]
+    while stack:
+        cls = stack.pop()
+        if cls in visited:
+            continue
+        visited.add(cls)
+        subclasses = [c for c in cls.__subclasses__() if not _is_generic_leaf(cls, c)]
+        if subclasses:
+            stack.extend(reversed(subclasses))
+        else:
             leaf_classes.append(cls)
 
-    find_subclasses(superclass)
+    _leaf_cache[superclass] = (tuple(leaf_classes), _subclass_generation)
     return leaf_classes
 
 
 def import_all(prefix: str) -> None:
-    files = [str(file) for file in Path.cwd().rglob("*.py") if file.is_file()]
+    global _subclass_generation
 
-    modules = [
-        module
-        for file in files
-        for module in [file.replace(str(Path.cwd()) + "/", "").replace("/", ".").replace(".py", "")]
-        if module.startswith(prefix)
-    ]
+    # Only the package that holds the prefix's last segment is walked, not the whole working tree.
+    *parents, _ = prefix.split(".")
+    root = Path.cwd().joinpath(*parents)
+    package = "".join(f"{parent}." for parent in parents)
+    modules = list(_find_modules(str(root), package, prefix)) if root.is_dir() else []
 
-    for module in modules:
+    pending = [module for module in modules if module not in sys.modules]
+    for module in pending:
         importlib.import_module(module)
 
+    if pending:
+        _subclass_generation += 1
+
+
+def _find_modules(directory: str, package: str, prefix: str) -> Iterator[str]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name == "__pycache__":
+                continue
+            if entry.is_dir():
+                module = package + entry.name
+                if module.startswith(prefix) or prefix.startswith(module + "."):
+                    yield from _find_modules(entry.path, module + ".", prefix)
+            elif entry.name.endswith(".py") and entry.is_file():
+                module = package + entry.name.removesuffix(".py")
+                if module.startswith(prefix):
+                    yield module
+
 
 TypeArgument = Union[Type, Any]
 
 
+_TYPE_CONSTRUCTORS: Dict[Any, Type[Any]] = {}
+
+
 def get_type_constructor(ty: Type[Any]) -> Type[Any]:
-    if hasattr(ty, "__pydantic_generic_metadata__"):
-        return ty.__pydantic_generic_metadata__["origin"] or ty
-    return typing.get_origin(ty) or ty
+    constructor = _TYPE_CONSTRUCTORS.get(ty)
+    if constructor is None:
+        if hasattr(ty, "__pydantic_generic_metadata__"):
+            constructor = ty.__pydantic_generic_metadata__["origin"] or ty
+        else:
+            constructor = typing.get_origin(ty) or ty
+        _TYPE_CONSTRUCTORS[ty] = constructor
+    return constructor
 
 
-def get_type_parameters(ty: Type) -> List[TypeVar]:
-    if hasattr(ty, "__parameters__"):
-        return list(ty.__parameters__)
-    if hasattr(ty, "__pydantic_generic_metadata__"):
-        return list(ty.__pydantic_generic_metadata__["parameters"])
-    return []
+# Parameters and arguments are cached as tuples so that shared results cannot be mutated by callers.
+_TYPE_PARAMETERS: Dict[Any, Tuple[TypeVar, ...]] = {}
+_TYPE_ARGUMENTS: Dict[Any, Tuple[TypeArgument, ...]] = {}
 
 
-def get_type_arguments(ty: Type) -> List[TypeArgument]:
-    if hasattr(ty, "__pydantic_generic_metadata__"):
-        return list(ty.__pydantic_generic_metadata__["args"])
-    return list(typing.get_args(ty))
+def get_type_parameters(ty: Type) -> Tuple[TypeVar, ...]:
+    parameters = _TYPE_PARAMETERS.get(ty)
+    if parameters is None:
+        if hasattr(ty, "__parameters__"):
+            parameters = tuple(ty.__parameters__)
+        elif hasattr(ty, "__pydantic_generic_metadata__"):
+            parameters = tuple(ty.__pydantic_generic_metadata__["parameters"])
+        else:
+            parameters = ()
+        _TYPE_PARAMETERS[ty] = parameters
+    return parameters
+
+
+def get_type_arguments(ty: Type) -> Tuple[TypeArgument, ...]:
+    arguments = _TYPE_ARGUMENTS.get(ty)
+    if arguments is None:
+        if hasattr(ty, "__pydantic_generic_metadata__"):
+            arguments = tuple(ty.__pydantic_generic_metadata__["args"])
+        else:
+            arguments = typing.get_args(ty)
+        _TYPE_ARGUMENTS[ty] = arguments
+    return arguments
 
 
 class UnboundTypeVar(ValueError):
     pass
 
 
+_TYPE_HINTS: Dict[Any, Dict[str, Any]] = {}
+_CONCRETE_TYPE_HINTS: Dict[Any, Dict[str, Type]] = {}
+
+
+def cached_type_hints(ty: Type[Any]) -> Dict[str, Any]:
+    hints = _TYPE_HINTS.get(ty)
+    if hints is None:
+        hints = _TYPE_HINTS[ty] = get_type_hints(ty)
+    return hints
+
+
+# The returned dict is shared between callers and must not be mutated.
 def concrete_type_hints(concrete: Type[T]) -> Dict[str, Type]:
+    hints = _CONCRETE_TYPE_HINTS.get(concrete)
+    if hints is None:
+        hints = _CONCRETE_TYPE_HINTS[concrete] = _resolve_concrete_type_hints(concrete)
+    return hints
+
+
+def _resolve_concrete_type_hints(concrete: Type[T]) -> Dict[str, Type]:
     origin = get_type_constructor(concrete)
-    hints = get_type_hints(origin)
+    hints = cached_type_hints(origin)
     if len(hints) == 0:
         return {}
-    params: List[TypeVar] = get_type_parameters(origin)
-    args: List[TypeArgument] = get_type_arguments(concrete) + [Any for _ in params]
+    params = get_type_parameters(origin)
+    args = get_type_arguments(concrete) + (Any,) * len(params)
     bindings: dict[TypeVar, TypeArgument] = dict(zip(params, args))
 
     concrete_hints = {}
@@ -89,12 +165,16 @@ def concrete_type_hints(concrete: Type[T]) -> Dict[str, Type]:
     return concrete_hints
 
 
+# Unbound type variables resolve to Any; Result is immutable, so one instance serves every such lookup.
+_UNBOUND_AS_ANY: Result[str, TypeArgument] = Result.ok(Any)
+
+
 def concrete_type(bound: dict[TypeVar, TypeArgument], generic: Type | TypeVar) -> Result[str, TypeArgument]:
     if isinstance(generic, TypeVar):
         if generic in bound:
             return Result.ok(bound[generic])
         else:
-            return Result.ok(Any)
+            return _UNBOUND_AS_ANY
 
     origin: Type = get_type_constructor(generic)
     args = get_type_arguments(generic)
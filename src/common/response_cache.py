@@ -0,0 +1,72 @@
+import hashlib
+import os
+import time
+
+from pathlib import Path
+from typing import Dict, Final, Optional, Tuple
+
+import orjson
+
+from common.config import get_config_dir
+
+
+CACHE_TTL: Final = 1800  # 30 minutes
+CACHE_MAX_ENTRIES: Final = 32
+
+Entries = Dict[str, Tuple[str, float]]
+
+
+def get_cache_path() -> Path:
+    return get_config_dir() / "response-cache.json"
+
+
+def cache_key(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _load_entries(path: Path) -> Entries:
+    try:
+        raw = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {key: (entry[0], entry[1]) for key, entry in raw.items() if _is_valid_entry(entry)}
+
+
+def _is_valid_entry(entry: object) -> bool:
+    return (
+        isinstance(entry, list)
+        and len(entry) == 2
+        and isinstance(entry[0], str)
+        and isinstance(entry[1], (int, float))
+        and not isinstance(entry[1], bool)
+    )
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    entry = _load_entries(get_cache_path()).get(key)
+    if entry is None or time.time() - entry[1] > CACHE_TTL:
+        return None
+    return entry[0]
+
+
+def cache_response(key: str, response: str) -> None:
+    """Best-effort: a cache that cannot be written is simply skipped."""
+    path = get_cache_path()
+    now = time.time()
+    entries = {k: v for k, v in _load_entries(path).items() if now - v[1] <= CACHE_TTL}
+    entries[key] = (response, now)
+    newest = sorted(entries.items(), key=lambda item: item[1][1], reverse=True)[:CACHE_MAX_ENTRIES]
+
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps(dict(newest)))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic, Callable, Union, List, Any, Awaitable
+from typing import TypeVar, Generic, Callable, Union, Iterable, List, Any, Awaitable
 from dataclasses import dataclass
 
 
@@ -7,12 +7,12 @@ S = TypeVar("S")
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Err(Generic[F]):
     error: F
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ok(Generic[S]):
     value: S
 
@@ -20,7 +20,9 @@ class Ok(Generic[S]):
 Unwrapped = Union[Err[F], Ok[S]]
 
 
-@dataclass(frozen=True)
+# Combinators test the inner value with isinstance rather than match, since they run per element in parsers;
+# Result is immutable, so the branch a combinator does not touch is passed through as-is instead of re-wrapped.
+@dataclass(frozen=True, slots=True)
 class Result(Generic[F, S]):
     inner: Unwrapped[F, S]
 
@@ -33,39 +35,34 @@ class Result(Generic[F, S]):
         return Result(Err(error))
 
     def map(self, func: Callable[[S], T]) -> "Result[F, T]":
-        match self.inner:
-            case Ok(value=value):
-                return Result(Ok(func(value)))
-            case Err(error=error):
-                return Result(Err(error))
+        inner = self.inner
+        if isinstance(inner, Ok):
+            return Result(Ok(func(inner.value)))
+        return self  # type: ignore[return-value]
 
     def map_err(self, func: Callable[[F], T]) -> "Result[T, S]":
-        match self.inner:
-            case Ok(value=value):
-                return Result(Ok(value))
-            case Err(error=error):
-                return Result(Err(func(error)))
+        inner = self.inner
+        if isinstance(inner, Err):
+            return Result(Err(func(inner.error)))
+        return self  # type: ignore[return-value]
 
     def then(self, func: Callable[[S], "Result[F, T]"]) -> "Result[F, T]":
-        match self.inner:
-            case Ok(value=value):
-                return func(value)
-            case Err(error=error):
-                return Result(Err(error))
+        inner = self.inner
+        if isinstance(inner, Ok):
+            return func(inner.value)
+        return self  # type: ignore[return-value]
 
     def unwrap(self) -> S:
-        match self.inner:
-            case Ok(value=value):
-                return value
-            case Err(error=error):
-                raise RuntimeError(f"Called unwrap on an Err value: {error}")
+        inner = self.inner
+        if isinstance(inner, Ok):
+            return inner.value
+        raise RuntimeError(f"Called unwrap on an Err value: {inner.error}")
 
     def unwrap_or(self, default: S) -> S:
-        match self.inner:
-            case Ok(value=value):
-                return value
-            case Err():
-                return default
+        inner = self.inner
+        if isinstance(inner, Ok):
+            return inner.value
+        return default
 
     @property
     def is_ok(self) -> bool:
@@ -76,15 +73,14 @@ class Result(Generic[F, S]):
         return isinstance(self.inner, Err)
 
     @staticmethod
-    def traverse(items: List[T], func: Callable[[T], "Result[F, S]"]) -> "Result[F, List[S]]":
+    def traverse(items: Iterable[T], func: Callable[[T], "Result[F, S]"]) -> "Result[F, List[S]]":
         results = []
         for item in items:
             result = func(item)
-            match result.inner:
-                case Ok(value=value):
-                    results.append(value)
-                case Err(error=error):
-                    return Result(Err(error))
+            inner = result.inner
+            if isinstance(inner, Err):
+                return result  # type: ignore[return-value]
+            results.append(inner.value)
         return Result(Ok(results))
 
 
@@ -97,7 +93,10 @@ def try_catch(func: Callable[[], S]) -> Result[Exception, S]:
 
 def safe(func: Callable[..., S]) -> Callable[..., Result[Exception, S]]:
     def wrapper(*args: Any, **kwargs: Any) -> Result[Exception, S]:
-        return try_catch(lambda: func(*args, **kwargs))
+        try:
+            return Result(Ok(func(*args, **kwargs)))
+        except Exception as e:
+            return Result(Err(e))
 
     return wrapper
 
@@ -111,6 +110,9 @@ async def async_try_catch(func: Callable[[], Awaitable[S]]) -> Result[Exception,
 
 def async_safe(func: Callable[..., Awaitable[S]]) -> Callable[..., Awaitable[Result[Exception, S]]]:
     async def wrapper(*args: Any, **kwargs: Any) -> Result[Exception, S]:
-        return await async_try_catch(lambda: func(*args, **kwargs))
+        try:
+            return Result(Ok(await func(*args, **kwargs)))
+        except Exception as e:
+            return Result(Err(e))
 
     return wrapper
@@ -1,19 +1,18 @@
-import json
+import functools
+import shlex
+import shutil
 import subprocess
 import sys
 import time
-import requests
 
+from dataclasses import dataclass
 from pathlib import Path
 from importlib.metadata import PackageNotFoundError, version
 from typing import Literal, Union
 
-from packaging.version import Version
+import orjson
 
-from rich.console import Console
-
-from common.base import BaseFrozen
-from common.config import get_config_dir
+from common.config import IS_WINDOWS, get_config_dir
 from common.result import Err, Ok, Result, try_catch
 
 
@@ -25,26 +24,31 @@ UV_TOOL_PATH_PART = "uv"
 UV_TOOL_NAME = "commit-gen"
 
 
-class NetworkError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class NetworkError:
     url: str
     message: str
 
 
-class VersionCheckError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class VersionCheckError:
     message: str
 
 
-class PackageNotInstalled(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class PackageNotInstalled:
     package: str
 
 
-class SubprocessError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class SubprocessError:
     command: str
     exit_code: int
     stderr: str
 
 
-class CacheError(BaseFrozen):
+@dataclass(frozen=True, slots=True)
+class CacheError:
     path: str
     message: str
 
@@ -69,6 +73,7 @@ def format_update_error(error: UpdateError) -> str:
             return "Unknown error"
 
 
+@functools.cache
 def get_current_version() -> Result[PackageNotInstalled, str]:
     try:
         return Result.ok(version(PACKAGE_NAME))
@@ -77,37 +82,33 @@ def get_current_version() -> Result[PackageNotInstalled, str]:
 
 
 def get_latest_version() -> Result[Union[NetworkError, VersionCheckError], str]:
+    from http.client import HTTPException
+    from urllib.request import Request, urlopen
+
+    request = Request(PYPI_URL, headers={"Accept": "application/json"})
     try:
-        response = requests.get(PYPI_URL, timeout=3)
-        response.raise_for_status()
-    except requests.RequestException as e:
+        with urlopen(request, timeout=3) as response:
+            body = response.read()
+    # URLError, HTTPError and timeouts are OSErrors; malformed or truncated responses raise HTTPException.
+    except (OSError, HTTPException) as e:
         return Result.err(NetworkError(url=PYPI_URL, message=str(e)))
 
     try:
-        data = response.json()
+        data = orjson.loads(body)
         return Result.ok(data["info"]["version"])
-    except (json.JSONDecodeError, KeyError) as e:
+    except (orjson.JSONDecodeError, KeyError, TypeError) as e:
         return Result.err(VersionCheckError(message=f"Invalid PyPI response: {e}"))
 
 
+# The cache file's mtime records the last check; its contents are never read.
 def should_check_update() -> Result[CacheError, bool]:
-    mkdir_result = try_catch(lambda: CACHE_FILE.parent.mkdir(parents=True, exist_ok=True))
-    match mkdir_result.inner:
-        case Err(error=e):
-            return Result.err(CacheError(path=str(CACHE_FILE.parent), message=str(e)))
-        case Ok():
-            pass
-
-    if not CACHE_FILE.exists():
+    try:
+        last_check = CACHE_FILE.stat().st_mtime
+    except FileNotFoundError:
         return Result.ok(True)
-
-    read_result = try_catch(lambda: json.loads(CACHE_FILE.read_text()))
-    match read_result.inner:
-        case Err():
-            return Result.ok(True)  # Cache corrupted, check anyway
-        case Ok(value=data):
-            last_check = data.get("last_check", 0)
-            return Result.ok(time.time() - last_check > CHECK_INTERVAL)
+    except OSError as e:
+        return Result.err(CacheError(path=str(CACHE_FILE), message=str(e)))
+    return Result.ok(time.time() - last_check > CHECK_INTERVAL)
 
 
 def save_check_timestamp() -> Result[CacheError, None]:
@@ -118,30 +119,39 @@ def save_check_timestamp() -> Result[CacheError, None]:
         case Ok():
             pass
 
-    write_result = try_catch(lambda: CACHE_FILE.write_text(json.dumps({"last_check": time.time()})))
-    match write_result.inner:
+    touch_result = try_catch(lambda: CACHE_FILE.touch())
+    match touch_result.inner:
         case Err(error=e):
             return Result.err(CacheError(path=str(CACHE_FILE), message=str(e)))
         case Ok():
             return Result.ok(None)
 
 
+def format_command(cmd: list[str]) -> str:
+    return subprocess.list2cmdline(cmd) if IS_WINDOWS else shlex.join(cmd)
+
+
 def run_command(cmd: list[str]) -> Result[SubprocessError, subprocess.CompletedProcess[str]]:
     try:
         completed = subprocess.run(cmd, capture_output=True, text=True)
         return Result.ok(completed)
     except FileNotFoundError as e:
-        return Result.err(SubprocessError(command=" ".join(cmd), exit_code=127, stderr=str(e)))
+        return Result.err(SubprocessError(command=format_command(cmd), exit_code=127, stderr=str(e)))
 
 
+@functools.cache
 def is_uv_tool_install() -> bool:
     exe_path = Path(sys.executable).resolve()
     parts = [p.lower() for p in exe_path.parts]
     return UV_TOOL_PATH_PART in parts and "tools" in parts and UV_TOOL_NAME in parts
 
 
-def try_uv_update() -> Result[SubprocessError, None]:
-    cmd = ["uv", "tool", "install", PACKAGE_NAME, "--force"]
+def _try_update(cmd: list[str]) -> Result[SubprocessError, None]:
+    # Installers are tried one at a time on purpose: running them concurrently and killing the losers could
+    # interrupt an install midway. Missing managers are ruled out with a PATH lookup instead of a failed spawn.
+    if shutil.which(cmd[0]) is None:
+        return Result.err(SubprocessError(command=format_command(cmd), exit_code=127, stderr=f"{cmd[0]}: not found"))
+
     result = run_command(cmd)
 
     match result.inner:
@@ -149,37 +159,21 @@ def try_uv_update() -> Result[SubprocessError, None]:
             return Result.ok(None)
         case Ok(value=cp):
             stderr = cp.stderr or cp.stdout or "Unknown error"
-            return Result.err(SubprocessError(command=" ".join(cmd), exit_code=cp.returncode, stderr=stderr))
+            return Result.err(SubprocessError(command=format_command(cmd), exit_code=cp.returncode, stderr=stderr))
         case Err(error=err):
             return Result.err(err)
 
 
-def try_pipx_update() -> Result[SubprocessError, None]:
-    cmd = ["pipx", "upgrade", PACKAGE_NAME]
-    result = run_command(cmd)
+def try_uv_update() -> Result[SubprocessError, None]:
+    return _try_update(["uv", "tool", "install", PACKAGE_NAME, "--force"])
 
-    match result.inner:
-        case Ok(value=cp) if cp.returncode == 0:
-            return Result.ok(None)
-        case Ok(value=cp):
-            stderr = cp.stderr or cp.stdout or "Unknown error"
-            return Result.err(SubprocessError(command=" ".join(cmd), exit_code=cp.returncode, stderr=stderr))
-        case Err(error=err):
-            return Result.err(err)
 
+def try_pipx_update() -> Result[SubprocessError, None]:
+    return _try_update(["pipx", "upgrade", PACKAGE_NAME])
 
-def try_pip_update() -> Result[SubprocessError, None]:
-    cmd = [sys.executable, "-m", "pip", "install", "--upgrade", PACKAGE_NAME]
-    result = run_command(cmd)
 
-    match result.inner:
-        case Ok(value=cp) if cp.returncode == 0:
-            return Result.ok(None)
-        case Ok(value=cp):
-            stderr = cp.stderr or cp.stdout or "Unknown error"
-            return Result.err(SubprocessError(command=" ".join(cmd), exit_code=cp.returncode, stderr=stderr))
-        case Err(error=err):
-            return Result.err(err)
+def try_pip_update() -> Result[SubprocessError, None]:
+    return _try_update([sys.executable, "-m", "pip", "install", "--upgrade", PACKAGE_NAME])
 
 
 def update_package() -> Result[SubprocessError, UpdateMethod]:
@@ -198,10 +192,15 @@ def update_package() -> Result[SubprocessError, UpdateMethod]:
     return pip_result.map(lambda _: "pip")
 
 
+@functools.cache
+def is_newer_version(latest: str, current: str) -> bool:
+    from packaging.version import Version
+
+    return Version(latest) > Version(current)
+
+
 def check_and_update() -> None:
     """Auto-update check on startup. Silently ignores errors to avoid interrupting user."""
-    console = Console()
-
     should_check_result = should_check_update()
     match should_check_result.inner:
         case Err():
@@ -226,7 +225,10 @@ def check_and_update() -> None:
         case Ok(value=latest):
             pass
 
-    if Version(latest) > Version(current):
+    if is_newer_version(latest, current):
+        from rich.console import Console
+
+        console = Console()
         console.print(f"Updating commit-gen {current} → {latest}...")
         update_result = update_package()
         match update_result.inner:
@@ -239,6 +241,8 @@ def check_and_update() -> None:
 
 def execute_update() -> int:
     """Manual update command. Returns exit code."""
+    from rich.console import Console
+
     console = Console()
 
     current_result = get_current_version()
@@ -257,7 +261,7 @@ def execute_update() -> int:
         case Ok(value=latest):
             pass
 
-    if Version(latest) <= Version(current):
+    if not is_newer_version(latest, current):
         console.print(f"Already at latest version ({current}).")
         return 0
 
@@ -270,3 +274,7 @@ def execute_update() -> int:
         case Err(error=update_err):
             console.print(f"[red]Update failed: {format_update_error(update_err)}[/red]")
             return 1
+
+
+if __name__ == "__main__":
+    sys.exit(execute_update())
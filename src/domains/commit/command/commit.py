@@ -1,27 +1,46 @@
+import asyncio
+import functools
 import os
-import subprocess
-import tempfile
+import random
+import re
 
-from typing import Any, Dict, Literal, Optional, Union
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, TypeVar, Union
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from common.base import BaseFrozen, BaseFrozenArbitrary, BaseSerializable
 from common.command.base_command import BaseCommand
 from common.command.base_command_handler import BaseCommandHandler
 from common.command.execute_command_handler import json_response, execute_command_handler
 from common.config import CommitConvention, load_config, get_api_key
-from common.loading import spinner
+from common.loading import StatusDisplay, spinner
 from common.prompts import prompt_commit_message, select_option, text_input, confirm_prompt
+from common.response_cache import cache_key, cache_response, get_cached_response
 from common.result import Result, Ok, Err, async_try_catch
 from rich.console import Console
+from rich.text import Text
 
 
+T = TypeVar("T")
+
 Action = Literal["generate"]
-Selection = Literal["commit", "commit_push", "regenerate", "adjust", "cancel"]
 
 PRIMARY_MODEL = "models/gemini-flash-latest"
 FALLBACK_MODEL = "models/gemini-flash-lite-latest"
 
+# Failures worth retrying on the same model; rate limits are handled by switching to FALLBACK_MODEL instead.
+# google-genai lets transport failures surface as httpx exceptions, which are not builtin OSErrors.
+TRANSIENT_ERRORS = (errors.ServerError, httpx.TransportError, TimeoutError, ConnectionError)
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+
+# Prefill time grows with input size, so oversized diffs are cut down before they are sent to the model.
+MAX_DIFF_CHARS = 60_000
+HUNK_HEAD_LINES = 200
+HUNK_TAIL_LINES = 100
+_FILE_BOUNDARY = re.compile(r"^(?=diff --git )", re.MULTILINE)
+
 
 class MissingApiKey(BaseFrozen):
     pass
@@ -79,6 +98,7 @@ class AdjustSignal(BaseFrozenArbitrary):
 LoopResult = Union["CommandResponse", RegenerateSignal, AdjustSignal]
 
 
+@dataclass(frozen=True)
 class Command(BaseCommand):
     action: str
 
@@ -99,23 +119,67 @@ def validate_api_key() -> Result[MissingApiKey, str]:
             return Result.err(MissingApiKey())
 
 
-def validate_git_repo(path: str) -> Result[NotGitRepo, str]:
-    result = subprocess.run(["git", "rev-parse", "--is-inside-work-tree"], capture_output=True, text=True, cwd=path)
-    if result.returncode != 0:
+async def _run_git(args: List[str], cwd: str, stdin: Optional[bytes] = None) -> Tuple[int, bytes, bytes]:
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    stdout, stderr = await proc.communicate(stdin)
+    return proc.returncode or 0, stdout, stderr
+
+
+def _decode(output: bytes) -> str:
+    return output.decode("utf-8", errors="replace")
+
+
+async def validate_git_repo(path: str) -> Result[NotGitRepo, str]:
+    returncode, _, _ = await _run_git(["rev-parse", "--is-inside-work-tree"], path)
+    if returncode != 0:
         return Result.err(NotGitRepo())
     return Result.ok(path)
 
 
-def get_staged_diff(path: str) -> Result[Union[GitError, NoStagedChanges], str]:
-    result = subprocess.run(["git", "diff", "--staged"], capture_output=True, cwd=path)
-    if result.returncode != 0:
-        return Result.err(
-            GitError(message=result.stderr.decode("utf-8", errors="replace").strip() or "Failed to get staged changes")
-        )
-    stdout = result.stdout.decode("utf-8", errors="replace")
-    if not stdout.strip():
+async def get_staged_diff(path: str) -> Result[Union[GitError, NoStagedChanges], str]:
+    returncode, stdout_bytes, stderr_bytes = await _run_git(["diff", "--staged"], path)
+    if returncode != 0:
+        return Result.err(GitError(message=_decode(stderr_bytes).strip() or "Failed to get staged changes"))
+    # Checked on the raw bytes so that an empty diff is never decoded or copied by strip().
+    if not stdout_bytes or stdout_bytes.isspace():
         return Result.err(NoStagedChanges())
-    return Result.ok(stdout)
+    return Result.ok(_decode(stdout_bytes))
+
+
+def _elision(count: int) -> str:
+    return f"... <{count} characters elided> ...\n"
+
+
+def _truncate_file_diff(section: str) -> str:
+    lines = section.splitlines(keepends=True)
+    if len(lines) <= HUNK_HEAD_LINES + HUNK_TAIL_LINES:
+        return section
+    middle = lines[HUNK_HEAD_LINES:-HUNK_TAIL_LINES]
+    elided = sum(map(len, middle))
+    return "".join((*lines[:HUNK_HEAD_LINES], _elision(elided), *lines[-HUNK_TAIL_LINES:]))
+
+
+def truncate_diff(diff: str, max_chars: int = MAX_DIFF_CHARS) -> str:
+    """Bound the diff to roughly `max_chars`, keeping the start and end of each file and every file header."""
+    if len(diff) <= max_chars:
+        return diff
+
+    truncated = "".join(_truncate_file_diff(section) for section in _FILE_BOUNDARY.split(diff) if section)
+    if len(truncated) <= max_chars:
+        return truncated
+
+    head_end = max_chars * 2 // 3
+    tail_start = len(truncated) - max_chars // 3
+    middle = truncated[head_end:tail_start]
+    skipped_headers = "".join(line for line in middle.splitlines(keepends=True) if line.startswith("diff --git "))
+    return "".join((truncated[:head_end], "\n", _elision(len(middle)), skipped_headers, truncated[tail_start:]))
 
 
 def validate_action(action: str) -> Result[UnsupportedAction, Action]:
@@ -129,15 +193,22 @@ async def generate_message(
     diff: str,
     convention: CommitConvention = CommitConvention.IMPERATIVE,
     custom_template: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Result[Union[Exception, EmptyAIResponse], str]:
+    system_instruction = prompt_commit_message(convention, custom_template)
+    key = cache_key(PRIMARY_MODEL, system_instruction, diff)
+    if use_cache and (cached := get_cached_response(key)) is not None:
+        return Result.ok(cached)
+
     async def attempt(model: str):
-        return await async_try_catch(lambda: _generate_message_impl(api_key, diff, convention, custom_template, model))
+        return await async_try_catch(lambda: _generate_message_impl(api_key, diff, system_instruction, model))
 
     result = await attempt(PRIMARY_MODEL)
     match result.inner:
         case Ok(value=msg):
             if not msg.strip():
                 return Result.err(EmptyAIResponse())
+            cache_response(key, msg)
             return Result.ok(msg)
         case Err(error=e):
             if is_rate_limit_error(e):
@@ -146,6 +217,7 @@ async def generate_message(
                 fallback_result = await attempt(FALLBACK_MODEL)
                 match fallback_result.inner:
                     case Ok(value=msg):
+                        # Not cached: the key names PRIMARY_MODEL, whose later runs should not be served this output.
                         if not msg.strip():
                             return Result.err(EmptyAIResponse())
                         return Result.ok(msg)
@@ -154,19 +226,8 @@ async def generate_message(
             return Result.err(e)
 
 
-async def _generate_message_impl(
-    api_key: str, diff: str, convention: CommitConvention, custom_template: Optional[str], model: str = PRIMARY_MODEL
-) -> str:
-    with spinner("Generating…", spinner_style="dots"):
-        response = await genai.Client(api_key=api_key).aio.models.generate_content(
-            model=model,
-            contents=diff,
-            config=types.GenerateContentConfig(
-                system_instruction=prompt_commit_message(diff, convention, custom_template),
-                response_mime_type="text/plain",
-            ),
-        )
-    return _extract_text(response)
+async def _generate_message_impl(api_key: str, diff: str, system_instruction: str, model: str = PRIMARY_MODEL) -> str:
+    return await _call_gemini(api_key, system_instruction, truncate_diff(diff), "Generating…", model)
 
 
 async def refine_message(
@@ -196,29 +257,71 @@ async def refine_message(
             return Result.err(e)
 
 
+# Static so every adjust round shares the same cacheable instruction prefix; only the contents vary.
+REFINE_PROMPT = (
+    "You revise commit messages. Use the diff and the user's adjustment to produce a polished commit message. "
+    "Preserve required formatting rules: SMALL=single line; MEDIUM/LARGE=title, blank line, bullets prefixed with '- '."
+)
+
+
 async def _refine_message_impl(
     api_key: str, current_message: str, adjustment: str, diff: str, model: str = PRIMARY_MODEL
 ) -> str:
-    system = (
-        "You revise commit messages. Use the diff and the user's adjustment to produce a polished commit message. "
-        "Preserve required formatting rules: SMALL=single line; MEDIUM/LARGE=title, blank line, bullets prefixed with '- '."
-    )
     contents = (
-        f"<diff>\n{diff}\n</diff>\n<current>\n{current_message}\n</current>\n<adjustment>\n{adjustment}\n</adjustment>"
+        f"<diff>\n{truncate_diff(diff)}\n</diff>\n"
+        f"<current>\n{current_message}\n</current>\n<adjustment>\n{adjustment}\n</adjustment>"
     )
-    with spinner("Refining…", spinner_style="dots"):
-        response = await genai.Client(api_key=api_key).aio.models.generate_content(
-            model=model,
-            contents=contents,
-            config=types.GenerateContentConfig(system_instruction=system, response_mime_type="text/plain"),
-        )
-    return _extract_text(response)
+    return await _call_gemini(api_key, REFINE_PROMPT, contents, "Refining…", model)
+
+
+async def _call_gemini(
+    api_key: str, system_instruction: str, contents: str, spinner_label: str, model: str = PRIMARY_MODEL
+) -> str:
+    config = types.GenerateContentConfig(system_instruction=system_instruction, response_mime_type="text/plain")
+    with spinner(spinner_label, spinner_style="dots") as status:
+
+        async def request() -> str:
+            stream = await _get_client(api_key).aio.models.generate_content_stream(
+                model=model, contents=contents, config=config
+            )
+            return await _collect_stream(stream, status)
+
+        return await _with_retry(request)
+
+
+async def _with_retry(request: Callable[[], Awaitable[T]], attempts: int = RETRY_ATTEMPTS) -> T:
+    """Retry transient failures with jittered exponential backoff; the last attempt's error propagates."""
+    for attempt in range(attempts - 1):
+        try:
+            return await request()
+        except TRANSIENT_ERRORS:
+            await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt + random.random() * 0.1)
+    return await request()
+
+
+async def _collect_stream(stream: AsyncIterator[types.GenerateContentResponse], status: StatusDisplay) -> str:
+    """Accumulate streamed chunks, showing the partial message in place of the spinner text."""
+    # Appending to one Text keeps each update proportional to the new chunk rather than the whole message.
+    partial = Text()
+    async for chunk in stream:
+        partial.append(_extract_text(chunk))
+        status.update(partial)
+    return partial.plain
+
+
+# One client per key so regenerate/adjust rounds reuse its connection pool instead of redoing the TLS handshake.
+@functools.cache
+def _get_client(api_key: str) -> genai.Client:
+    return genai.Client(api_key=api_key)
 
 
 def _extract_text(response: types.GenerateContentResponse) -> str:
-    candidates = getattr(response, "candidates", ()) or ()
-    parts = tuple(p for c in candidates for p in (getattr(getattr(c, "content", None), "parts", ()) or ()))
-    return "".join(text for p in parts if (text := getattr(p, "text", None)))
+    return "".join(
+        text
+        for c in getattr(response, "candidates", None) or ()
+        for p in getattr(getattr(c, "content", None), "parts", None) or ()
+        if (text := getattr(p, "text", None))
+    )
 
 
 def is_rate_limit_error(error: Exception) -> bool:
@@ -226,149 +329,149 @@ def is_rate_limit_error(error: Exception) -> bool:
     return "429" in error_str or "resource_exhausted" in error_str
 
 
-def perform_commit(message: str, cwd: str) -> Result[GitError, str]:
-    with tempfile.NamedTemporaryFile("w", delete=False) as tmp:
-        tmp.write(message)
-        tmp_path = tmp.name
-    try:
-        result = subprocess.run(["git", "commit", "-F", tmp_path], capture_output=True, text=True, cwd=cwd)
-        output = (result.stdout or "") + (result.stderr or "")
-        if result.returncode != 0:
-            return Result.err(GitError(message=output.strip() or "Commit failed"))
-        stats_only = "\n".join(line for line in output.strip().split("\n") if not line.startswith("["))
-        return Result.ok("\n" + stats_only + "\n")
-    finally:
-        try:
-            os.unlink(tmp_path)
-        except Exception:
-            pass
+async def perform_commit(message: str, cwd: str) -> Result[GitError, str]:
+    returncode, stdout, stderr = await _run_git(["commit", "-F", "-"], cwd, stdin=message.encode("utf-8"))
+    output = _decode(b"".join((stdout, stderr)))
+    if returncode != 0:
+        return Result.err(GitError(message=output.strip() or "Commit failed"))
+    stats_only = "\n".join(line for line in output.strip().split("\n") if not line.startswith("["))
+    return Result.ok("\n" + stats_only + "\n")
 
 
 async def perform_push_or_publish(cwd: str) -> Result[Union[GitError, PushSkipped], str]:
-    upstream_check = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "@{u}"], capture_output=True, text=True, cwd=cwd
-    )
+    upstream_returncode, _, _ = await _run_git(["rev-parse", "--abbrev-ref", "@{u}"], cwd)
 
-    if upstream_check.returncode == 0:
-        result = subprocess.run(["git", "push"], capture_output=True, text=True, cwd=cwd)
+    if upstream_returncode == 0:
+        returncode, stdout, stderr = await _run_git(["push"], cwd)
     else:
-        branch_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True, cwd=cwd
-        )
-        branch = branch_result.stdout.strip()
+        _, branch_stdout, _ = await _run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd)
+        branch = _decode(branch_stdout).strip()
 
         publish = await confirm_prompt(f"Branch '{branch}' has no upstream. Publish to origin?")
         if not publish:
             return Result.err(PushSkipped())
 
-        result = subprocess.run(
-            ["git", "push", "--set-upstream", "origin", branch], capture_output=True, text=True, cwd=cwd
-        )
+        returncode, stdout, stderr = await _run_git(["push", "--set-upstream", "origin", branch], cwd)
 
-    output = (result.stdout or "") + (result.stderr or "")
-    if result.returncode != 0:
+    output = _decode(b"".join((stdout, stderr)))
+    if returncode != 0:
         return Result.err(GitError(message=output.strip() or "Push failed"))
     return Result.ok(output)
 
 
-async def handle_selection(selection: Selection, state: CommitState) -> Result[CommitError, LoopResult]:
-    match selection:
-        case "commit":
-            commit_result = perform_commit(state.message, state.cwd)
-            match commit_result.inner:
-                case Err(error=git_err):
-                    return Result[CommitError, LoopResult].err(git_err)
-                case Ok(value=commit_output):
-                    return Result[CommitError, LoopResult].ok(
+def _committed(state: CommitState, commit_output: str) -> Result[CommitError, LoopResult]:
+    return Result.ok(
+        CommandResponse(message="commit", commit_message=state.message, action="commit", git_output=commit_output)
+    )
+
+
+async def _commit(state: CommitState) -> Result[CommitError, LoopResult]:
+    commit_result = await perform_commit(state.message, state.cwd)
+    match commit_result.inner:
+        case Err(error=git_err):
+            return Result.err(git_err)
+        case Ok(value=commit_output):
+            return _committed(state, commit_output)
+
+
+async def _commit_push(state: CommitState) -> Result[CommitError, LoopResult]:
+    commit_result = await perform_commit(state.message, state.cwd)
+    match commit_result.inner:
+        case Err(error=git_err):
+            return Result.err(git_err)
+        case Ok(value=commit_output):
+            push_result = await perform_push_or_publish(state.cwd)
+            match push_result.inner:
+                case Err(error=PushSkipped()):
+                    return _committed(state, commit_output)
+                case Err(error=push_err):
+                    return Result.err(push_err)
+                case Ok(value=push_output):
+                    return Result.ok(
                         CommandResponse(
-                            message="commit", commit_message=state.message, action="commit", git_output=commit_output
+                            message="commit_push",
+                            commit_message=state.message,
+                            action="commit_push",
+                            git_output=f"{commit_output}{push_output}",
                         )
                     )
-        case "commit_push":
-            commit_result = perform_commit(state.message, state.cwd)
-            match commit_result.inner:
-                case Err(error=git_err):
-                    return Result[CommitError, LoopResult].err(git_err)
-                case Ok(value=commit_output):
-                    push_result = await perform_push_or_publish(state.cwd)
-                    match push_result.inner:
-                        case Err(error=PushSkipped()):
-                            return Result[CommitError, LoopResult].ok(
-                                CommandResponse(
-                                    message="commit",
-                                    commit_message=state.message,
-                                    action="commit",
-                                    git_output=commit_output,
-                                )
-                            )
-                        case Err(error=push_err):
-                            return Result[CommitError, LoopResult].err(push_err)
-                        case Ok(value=push_output):
-                            return Result[CommitError, LoopResult].ok(
-                                CommandResponse(
-                                    message="commit_push",
-                                    commit_message=state.message,
-                                    action="commit_push",
-                                    git_output=f"{commit_output}{push_output}",
-                                )
-                            )
-        case "regenerate":
-            return Result.ok(RegenerateSignal(state=state))
-        case "adjust":
-            return Result.ok(AdjustSignal(state=state))
-        case "cancel":
-            return Result.ok(CommandResponse(message="cancelled", commit_message=state.message, action="cancel"))
+
+
+async def _regenerate(state: CommitState) -> Result[CommitError, LoopResult]:
+    return Result.ok(RegenerateSignal(state=state))
+
+
+async def _adjust(state: CommitState) -> Result[CommitError, LoopResult]:
+    return Result.ok(AdjustSignal(state=state))
+
+
+async def _cancel(state: CommitState) -> Result[CommitError, LoopResult]:
+    return Result.ok(CommandResponse(message="cancelled", commit_message=state.message, action="cancel"))
+
+
+# Single source of truth for the menu actions; anything else (including a dismissed prompt) cancels.
+_ACTIONS: Dict[str, Callable[[CommitState], Awaitable[Result[CommitError, LoopResult]]]] = {
+    "commit": _commit,
+    "commit_push": _commit_push,
+    "regenerate": _regenerate,
+    "adjust": _adjust,
+    "cancel": _cancel,
+}
+
+
+async def handle_selection(selection: Optional[str], state: CommitState) -> Result[CommitError, LoopResult]:
+    handler = _ACTIONS.get(selection or "cancel", _cancel)
+    return await handler(state)
 
 
 async def interaction_loop(state: CommitState, console: Console) -> Result[CommitError, CommandResponse]:
-    console.print("")
-    console.print(state.message)
-    console.print("")
-
-    raw_selection = await select_option(
-        "Select action:",
-        [
-            ("Commit & Push", "commit_push"),
-            ("Commit", "commit"),
-            ("Regenerate", "regenerate"),
-            ("Adjust", "adjust"),
-            ("Cancel", "cancel"),
-        ],
-    )
+    while True:
+        console.print("")
+        console.print(state.message)
+        console.print("")
+
+        raw_selection = await select_option(
+            "Select action:",
+            [
+                ("Commit & Push", "commit_push"),
+                ("Commit", "commit"),
+                ("Regenerate", "regenerate"),
+                ("Adjust", "adjust"),
+                ("Cancel", "cancel"),
+            ],
+        )
 
-    selection: Selection
-    if raw_selection in ("commit", "commit_push", "regenerate", "adjust", "cancel"):
-        selection = raw_selection  # type: ignore[assignment]
-    else:
-        selection = "cancel"
-    result = await handle_selection(selection, state)
+        result = await handle_selection(raw_selection, state)
 
-    match result.inner:
-        case Ok(value=loop_result):
-            match loop_result:
-                case RegenerateSignal(state=s):
-                    gen_result = await generate_message(s.api_key, s.diff, s.convention, s.custom_template)
-                    match gen_result.inner:
-                        case Ok(value=new_msg):
-                            return await interaction_loop(s.with_message(new_msg), console)
-                        case Err(error=e):
-                            console.print(f"[red]Generation failed: {e}[/red]")
-                            return await interaction_loop(s, console)
-                case AdjustSignal(state=s):
-                    adj = await text_input("What adjustments would you like?")
-                    if not adj:
-                        return await interaction_loop(s, console)
-                    refine_result = await refine_message(s.api_key, s.message, adj, s.diff)
-                    match refine_result.inner:
-                        case Ok(value=new_msg):
-                            return await interaction_loop(s.with_message(new_msg), console)
-                        case Err(error=e):
-                            console.print(f"[red]Refinement failed: {e}[/red]")
-                            return await interaction_loop(s, console)
-                case CommandResponse() as response:
-                    return Result.ok(response)
-        case Err(error=e):
-            return Result.err(e)
+        match result.inner:
+            case Ok(value=loop_result):
+                match loop_result:
+                    case RegenerateSignal(state=s):
+                        gen_result = await generate_message(
+                            s.api_key, s.diff, s.convention, s.custom_template, use_cache=False
+                        )
+                        match gen_result.inner:
+                            case Ok(value=new_msg):
+                                state = s.with_message(new_msg)
+                            case Err(error=e):
+                                console.print(f"[red]Generation failed: {e}[/red]")
+                                state = s
+                    case AdjustSignal(state=s):
+                        adj = await text_input("What adjustments would you like?")
+                        if not adj:
+                            state = s
+                            continue
+                        refine_result = await refine_message(s.api_key, s.message, adj, s.diff)
+                        match refine_result.inner:
+                            case Ok(value=new_msg):
+                                state = s.with_message(new_msg)
+                            case Err(error=e):
+                                console.print(f"[red]Refinement failed: {e}[/red]")
+                                state = s
+                    case CommandResponse() as response:
+                        return Result.ok(response)
+            case Err(error=e):
+                return Result.err(e)
 
 
 async def execute_commit_flow(action: str, console: Console) -> Result[CommitError, CommandResponse]:
@@ -397,14 +500,14 @@ async def execute_commit_flow(action: str, console: Console) -> Result[CommitErr
             pass
 
     cwd = os.getcwd()
-    repo_result = validate_git_repo(cwd)
+    # Both git probes are independent; run them concurrently and report the repository check first.
+    repo_result, diff_result = await asyncio.gather(validate_git_repo(cwd), get_staged_diff(cwd))
     match repo_result.inner:
         case Err(error=repo_err):
             return Result.err(repo_err)
         case Ok():
             pass
 
-    diff_result = get_staged_diff(cwd)
     match diff_result.inner:
         case Err(error=diff_err):
             return Result.err(diff_err)
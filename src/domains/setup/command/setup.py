@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Any, Dict, Optional, Union
 
 from google import genai
@@ -7,9 +8,16 @@ from common.base import BaseFrozen, BaseSerializable
 from common.command.base_command import BaseCommand
 from common.command.base_command_handler import BaseCommandHandler
 from common.command.execute_command_handler import json_response, execute_command_handler
-from common.config import CommitConvention, Config, ConfigWriteError, save_config
+from common.config import (
+    CommitConvention,
+    Config,
+    ConfigWriteError,
+    get_config_path,
+    get_legacy_config_dir,
+    save_config,
+)
 from common.loading import spinner
-from common.prompts import select_option, password_input, confirm_prompt
+from common.prompts import select_option, password_input, confirm_prompt, text_input
 from common.result import Result, Ok, Err, async_try_catch
 
 
@@ -29,6 +37,7 @@ class SetupResponse(BaseSerializable):
     config_path: Optional[str] = None
 
 
+@dataclass(frozen=True)
 class Command(BaseCommand):
     pass
 
@@ -56,8 +65,6 @@ async def prompt_convention(console: Console) -> Optional[CommitConvention]:
 
 
 async def prompt_custom_template(console: Console) -> Optional[str]:
-    from common.prompts import text_input
-
     console.print("\n[dim]Enter your custom commit message template.[/dim]")
     console.print("[dim]Use {diff} as placeholder for the git diff.[/dim]\n")
     return await text_input("Custom template:")
@@ -77,10 +84,9 @@ async def validate_api_key(api_key: str) -> Result[InvalidApiKey, str]:
 
 
 async def _validate_api_key_impl(api_key: str) -> None:
+    # A model metadata lookup authenticates the key without spending a generation.
     with spinner("Validating API key...", spinner_style="dots"):
-        await genai.Client(api_key=api_key).aio.models.generate_content(
-            model="models/gemini-flash-latest", contents="Say 'ok' in one word."
-        )
+        await genai.Client(api_key=api_key).aio.models.get(model="models/gemini-flash-latest")
 
 
 async def execute_setup_flow(console: Console) -> Result[SetupError, SetupResponse]:
@@ -118,8 +124,6 @@ async def execute_setup_flow(console: Console) -> Result[SetupError, SetupRespon
         case Ok():
             pass
 
-    from common.config import get_config_path, get_legacy_config_dir
-
     # Legacy config cleanup
     legacy_path = get_legacy_config_dir()
     if legacy_path.exists():
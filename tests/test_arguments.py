@@ -1,8 +1,8 @@
 import io
 import sys
+import types
 import unittest
 from contextlib import redirect_stdout
-from importlib.metadata import PackageNotFoundError
 from pathlib import Path
 from unittest.mock import patch
 
@@ -13,14 +13,49 @@ import common.arguments as arguments
 
 
 class ResolveVersionTests(unittest.TestCase):
-    def test_version_argument_falls_back_when_metadata_missing(self) -> None:
-        with patch("common.arguments.get_version", side_effect=PackageNotFoundError("commit-gen")):
+    def setUp(self) -> None:
+        arguments.create_parser.cache_clear()
+        arguments.resolve_version.cache_clear()
+
+    def test_version_argument_falls_back_when_version_file_missing(self) -> None:
+        with patch.dict(sys.modules, {"common._version": None}):
             parser = arguments.create_parser()
-            with redirect_stdout(io.StringIO()):
+            output = io.StringIO()
+            with redirect_stdout(output):
                 with self.assertRaises(SystemExit) as context:
                     parser.parse_args(["--version"])
 
         self.assertEqual(context.exception.code, 0)
+        self.assertEqual(output.getvalue().strip(), "commit unknown")
+
+    def test_version_argument_reads_build_time_constant(self) -> None:
+        version_module = types.ModuleType("common._version")
+        version_module.__version__ = "1.2.3"  # type: ignore[attr-defined]
+        with patch.dict(sys.modules, {"common._version": version_module}):
+            self.assertEqual(arguments.resolve_version(), "1.2.3")
+
+
+class FastDispatchTests(unittest.TestCase):
+    def test_bare_command_resolves_without_parser(self) -> None:
+        self.assertEqual(arguments.fast_dispatch(["generate"]), arguments.CommandType.GENERATE)
+        self.assertEqual(arguments.fast_dispatch(["doctor"]), arguments.CommandType.DOCTOR)
+
+    def test_falls_back_for_flags_and_unknown_input(self) -> None:
+        self.assertIsNone(arguments.fast_dispatch([]))
+        self.assertIsNone(arguments.fast_dispatch(["--help"]))
+        self.assertIsNone(arguments.fast_dispatch(["generate", "--help"]))
+        self.assertIsNone(arguments.fast_dispatch(["translate"]))
+
+
+class VersionRequestedTests(unittest.TestCase):
+    def test_bare_version_flags_skip_full_parser(self) -> None:
+        self.assertTrue(arguments.version_requested(["-v"]))
+        self.assertTrue(arguments.version_requested(["--version"]))
+
+    def test_other_invocations_need_full_parser(self) -> None:
+        self.assertFalse(arguments.version_requested([]))
+        self.assertFalse(arguments.version_requested(["--help"]))
+        self.assertFalse(arguments.version_requested(["generate", "--version"]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from common.result import Ok
+from domains.commit.command.commit import FALLBACK_MODEL, PRIMARY_MODEL, _with_retry, generate_message, truncate_diff
+
+
+def file_diff(name: str, lines: int) -> str:
+    header = f"diff --git a/{name} b/{name}\n--- a/{name}\n+++ b/{name}\n@@ -0,0 +1,{lines} @@\n"
+    return header + "".join(f"+line {i}\n" for i in range(lines))
+
+
+class TruncateDiffTests(unittest.TestCase):
+    def test_small_diff_is_unchanged(self) -> None:
+        diff = file_diff("a.py", 10)
+        self.assertIs(truncate_diff(diff), diff)
+
+    def test_long_file_keeps_head_and_tail(self) -> None:
+        diff = file_diff("a.py", 1000)
+        truncated = truncate_diff(diff, max_chars=1000 * 4)
+        self.assertLess(len(truncated), len(diff))
+        self.assertTrue(truncated.startswith("diff --git a/a.py b/a.py\n"))
+        self.assertIn("characters elided", truncated)
+        self.assertTrue(truncated.endswith("+line 999\n"))
+
+    def test_every_file_header_survives(self) -> None:
+        diff = "".join(file_diff(f"f{i}.py", 50) for i in range(100))
+        truncated = truncate_diff(diff, max_chars=5000)
+        self.assertLess(len(truncated), len(diff))
+        for i in range(100):
+            self.assertIn(f"diff --git a/f{i}.py b/f{i}.py", truncated)
+
+
+class WithRetryTests(unittest.TestCase):
+    def run_with_retry(self, outcomes: list) -> tuple:
+        calls = []
+
+        async def request() -> str:
+            outcome = outcomes[len(calls)]
+            calls.append(outcome)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch("domains.commit.command.commit.asyncio.sleep", new=AsyncMock()):
+            try:
+                return asyncio.run(_with_retry(request)), len(calls)
+            except Exception as e:
+                return e, len(calls)
+
+    def test_retries_transient_errors(self) -> None:
+        self.assertEqual(self.run_with_retry([TimeoutError(), ConnectionError(), "Add feature"]), ("Add feature", 3))
+
+    def test_retries_httpx_transport_errors(self) -> None:
+        self.assertEqual(self.run_with_retry([httpx.ConnectError("refused"), "Add feature"]), ("Add feature", 2))
+
+    def test_gives_up_after_last_attempt(self) -> None:
+        result, calls = self.run_with_retry([TimeoutError(), TimeoutError(), TimeoutError("final")])
+        self.assertIsInstance(result, TimeoutError)
+        self.assertEqual(str(result), "final")
+        self.assertEqual(calls, 3)
+
+    def test_does_not_retry_other_errors(self) -> None:
+        result, calls = self.run_with_retry([ValueError("bad request"), "unused"])
+        self.assertIsInstance(result, ValueError)
+        self.assertEqual(calls, 1)
+
+
+class GenerateMessageCacheTests(unittest.TestCase):
+    def run_generate(self, replies: dict) -> tuple:
+        async def call_gemini(api_key: str, system_instruction: str, contents: str, label: str, model: str) -> str:
+            reply = replies[model]
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        with (
+            patch("domains.commit.command.commit._call_gemini", new=call_gemini),
+            patch("domains.commit.command.commit.get_cached_response", return_value=None),
+            patch("domains.commit.command.commit.cache_response") as cache_response,
+            patch("domains.commit.command.commit.Console"),
+        ):
+            result = asyncio.run(generate_message("key", file_diff("a.py", 3)))
+        return result, cache_response
+
+    def test_caches_primary_model_output(self) -> None:
+        result, cache_response = self.run_generate({PRIMARY_MODEL: "Add a"})
+        self.assertEqual(result.inner, Ok(value="Add a"))
+        cache_response.assert_called_once()
+
+    def test_does_not_cache_fallback_output(self) -> None:
+        replies = {PRIMARY_MODEL: RuntimeError("429 RESOURCE_EXHAUSTED"), FALLBACK_MODEL: "Add a"}
+        result, cache_response = self.run_generate(replies)
+        self.assertEqual(result.inner, Ok(value="Add a"))
+        cache_response.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import common.config as config
+from common.result import Err, Ok
+
+
+class LoadConfigTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config_path = Path(self.tmp.name) / "config.json"
+        patcher = patch("common.config.get_config_path", return_value=self.config_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, data: object) -> None:
+        self.config_path.write_text(json.dumps(data))
+
+    def test_missing_file_is_not_found(self) -> None:
+        result = config.load_config()
+        self.assertEqual(result.inner, Err(config.ConfigNotFound(path=str(self.config_path))))
+
+    def test_invalid_json_is_parse_error(self) -> None:
+        self.config_path.write_text("{not json")
+        result = config.load_config()
+        assert isinstance(result.inner, Err)
+        self.assertIsInstance(result.inner.error, config.ConfigParseError)
+
+    def test_invalid_convention_is_reported(self) -> None:
+        self.write({"api_key": "k", "commit_convention": "shouting"})
+        result = config.load_config()
+        self.assertEqual(result.inner, Err(config.ConfigParseError(message="Invalid commit convention: shouting")))
+
+    def test_valid_config_loads(self) -> None:
+        self.write({"api_key": "k", "commit_convention": "conventional", "custom_template": None})
+        result = config.load_config()
+        self.assertEqual(
+            result.inner, Ok(config.Config(api_key="k", commit_convention=config.CommitConvention.CONVENTIONAL))
+        )
+
+
+class ApiKeyCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config_path = Path(self.tmp.name) / "config.json"
+        for patcher in (
+            patch("common.config.get_config_path", return_value=self.config_path),
+            patch.dict("os.environ", {"GOOGLE_API_KEY": ""}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        config.reset_api_key_cache()
+        self.addCleanup(config.reset_api_key_cache)
+
+    def save(self, api_key: str) -> None:
+        result = config.save_config(
+            config.Config(api_key=api_key, commit_convention=config.CommitConvention.IMPERATIVE)
+        )
+        self.assertTrue(result.is_ok)
+
+    def test_key_is_cached_until_config_is_saved(self) -> None:
+        self.save("first")
+        self.assertEqual(config.get_api_key().unwrap(), "first")
+
+        self.config_path.write_text(json.dumps({"api_key": "edited", "commit_convention": "imperative"}))
+        self.assertEqual(config.get_api_key().unwrap(), "first")
+
+        self.save("second")
+        self.assertEqual(config.get_api_key().unwrap(), "second")
+
+
+if __name__ == "__main__":
+    unittest.main()
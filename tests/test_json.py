@@ -0,0 +1,121 @@
+import sys
+import unittest
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Union
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from common.base import BaseSerializable
+from common.json import ParsingOptions, parse_json, parser_for, to_json, try_parse_json
+from common.result import Err, Ok
+
+
+class Item(BaseSerializable):
+    name: str
+    count: int
+    tags: List[str]
+    kind: Literal["a", "b"]
+    note: Optional[str] = None
+
+
+class ParserForTests(unittest.TestCase):
+    def test_parser_is_resolved_once_per_type(self) -> None:
+        self.assertIs(parser_for(List[int]), parser_for(List[int]))
+        self.assertIs(parser_for(Item), parser_for(Item))
+
+    def test_parses_nested_model(self) -> None:
+        data = {"name": "x", "count": 2, "tags": ["a", "b"], "kind": "b"}
+        item = parse_json(Item, data)
+        self.assertEqual(item, Item(name="x", count=2, tags=["a", "b"], kind="b"))
+
+    def test_fills_missing_optionals_when_requested(self) -> None:
+        data = {"name": "x", "count": 2, "tags": [], "kind": "a"}
+        result = try_parse_json(Item, data, ParsingOptions(fill_missing_optionals=True))
+        match result.inner:
+            case Ok(value=value):
+                self.assertIsNone(value.note)
+            case Err(error=error):
+                self.fail(error)
+
+    def test_int_fields_reject_bools(self) -> None:
+        self.assertIsInstance(try_parse_json(int, True).inner, Err)
+        self.assertIsInstance(try_parse_json(bool, True).inner, Ok)
+
+    def test_literal_matches_exact_values(self) -> None:
+        self.assertIsInstance(try_parse_json(Literal["a", 1], "a").inner, Ok)
+        self.assertIsInstance(try_parse_json(Literal["a", 1], "b").inner, Err)
+        self.assertIsInstance(try_parse_json(Literal[1], True).inner, Err)
+        match try_parse_json(Literal["a"], 2**70).inner:
+            case Err(error=error):
+                self.assertEqual(error, f"Expected one of 'a' but found {2**70}")
+            case Ok():
+                self.fail("expected a literal mismatch")
+
+    def test_union_takes_first_success_unless_strict(self) -> None:
+        self.assertEqual(parse_json(Union[Any, int], 1), 1)
+        strict = ParsingOptions(fill_missing_optionals=False, reject_ambiguous_unions=True)
+        match try_parse_json(Union[Any, int], 1, strict).inner:
+            case Err(error=error):
+                self.assertEqual(error, "Ambiguous parse of 1: 1, 1")
+            case Ok():
+                self.fail("expected an ambiguity error")
+
+    def test_scalar_lists_are_copied(self) -> None:
+        data = ["a", "b"]
+        parsed = parse_json(List[str], data)
+        self.assertEqual(parsed, data)
+        self.assertIsNot(parsed, data)
+        self.assertIsInstance(try_parse_json(List[int], [1, True]).inner, Err)
+
+    def test_reports_list_index_on_error(self) -> None:
+        result = try_parse_json(Dict[str, List[int]], {"k": [1, "2"]})
+        match result.inner:
+            case Err(error=error):
+                self.assertIn("At index 1", error)
+            case Ok():
+                self.fail("expected a parse error")
+
+    def test_error_payloads_beyond_orjson_range(self) -> None:
+        match try_parse_json(Item, [2**70]).inner:
+            case Err(error=error):
+                self.assertIn(str(2**70), error)
+            case Ok():
+                self.fail("expected a parse error")
+        match try_parse_json(Item, [2**70, None]).inner:
+            case Err(error=error):
+                self.assertTrue(error.endswith(f"from value: [{2**70},null]"))
+            case Ok():
+                self.fail("expected a parse error")
+
+    def test_error_payloads_are_compact(self) -> None:
+        match try_parse_json(Item, [{"a": None}, float("nan")]).inner:
+            case Err(error=error):
+                self.assertTrue(error.endswith('from value: [{"a":null},null]'))
+            case Ok():
+                self.fail("expected a parse error")
+
+
+class Colour(str, Enum):
+    RED = "red"
+
+
+class ToJsonTests(unittest.TestCase):
+    def test_serializes_nested_builtins(self) -> None:
+        data = {"a": [1, 2.5, True, None], "b": {"c": Decimal("1.10")}, "d": {"x"}}
+        self.assertEqual(to_json(data), {"a": [1, 2.5, True, None], "b": {"c": "1.10"}, "d": ["x"]})
+
+    def test_serializes_models_and_builtin_subclasses(self) -> None:
+        item = Item(name="x", count=1, tags=["t"], kind="a")
+        self.assertEqual(to_json([item, Colour.RED])[0]["tags"], ["t"])
+        self.assertIs(to_json(Colour.RED), Colour.RED)
+
+    def test_rejects_unknown_types(self) -> None:
+        with self.assertRaises(ValueError):
+            to_json(object())  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import common.response_cache as response_cache
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_path = Path(self.tmp.name) / "response-cache.json"
+        patcher = patch("common.response_cache.get_cache_path", return_value=self.cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trips_a_response(self) -> None:
+        key = response_cache.cache_key("model", "diff")
+        self.assertIsNone(response_cache.get_cached_response(key))
+        response_cache.cache_response(key, "Add feature")
+        self.assertEqual(response_cache.get_cached_response(key), "Add feature")
+
+    def test_keys_do_not_collide_across_part_boundaries(self) -> None:
+        self.assertNotEqual(response_cache.cache_key("ab", "c"), response_cache.cache_key("a", "bc"))
+
+    def test_expired_entries_are_ignored(self) -> None:
+        key = response_cache.cache_key("model", "diff")
+        with patch("common.response_cache.time.time", return_value=0.0):
+            response_cache.cache_response(key, "Old message")
+        self.assertIsNone(response_cache.get_cached_response(key))
+
+    def test_corrupt_cache_is_treated_as_empty(self) -> None:
+        self.cache_path.write_text("not json")
+        self.assertIsNone(response_cache.get_cached_response("anything"))
+
+    def test_malformed_entries_are_dropped(self) -> None:
+        self.cache_path.write_text('{"a": ["msg", "x"], "b": [1, 2.0], "c": ["msg", true], "d": ["kept", 1]}')
+        with patch("common.response_cache.time.time", return_value=2.0):
+            for key in ("a", "b", "c"):
+                self.assertIsNone(response_cache.get_cached_response(key))
+            self.assertEqual(response_cache.get_cached_response("d"), "kept")
+
+
+if __name__ == "__main__":
+    unittest.main()